@@ -5,17 +5,28 @@ __email__ = "david.haney@gmail.com"
 __version__ = "1.0.0"
 
 
-import codecs
+from . import encodings, index
+from .batch import decode_many, encode_many
+from .detect import detect_encoding, open_gedcom
+from .encodings import define_dialect
+from .files import decode_file
+from .parallel import parallel_decode, parallel_encode
+from .records import gedcom_records
 
-from .encodings import ansel, gedcom
+__all__ = [
+    "decode_file",
+    "decode_many",
+    "define_dialect",
+    "detect_encoding",
+    "encode_many",
+    "gedcom_records",
+    "index",
+    "open_gedcom",
+    "parallel_decode",
+    "parallel_encode",
+    "register",
+]
 
 
 def register():
-    def encoding_lookup(name):
-        if name == "ansel":
-            return ansel.getregentry()
-        elif name == "gedcom":
-            return gedcom.getregentry()
-        return None
-
-    codecs.register(encoding_lookup)
+    encodings.register()
@@ -0,0 +1,836 @@
+/*
+ * C implementation of the decoder and encoder state machines from
+ * ansel/incremental.py.
+ *
+ * The functions exported here have the same signatures and behavior as
+ * ansel.incremental.py_decode and ansel.incremental.py_encode, which remain
+ * the reference implementation. The passthrough pattern argument is accepted
+ * for compatibility but unused, since every byte is already translated with a
+ * single table lookup.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define DECODE_CHAR 0
+#define DECODE_CONTROL 1
+#define DECODE_MODIFIER 2
+
+static const char UNDEFINED_REASON[] = "character maps to <undefined>";
+static const char TOO_MANY_MODIFIERS_REASON[] = "too many combining characters";
+
+/* Growable buffer of code points used to build the decoded string. */
+typedef struct {
+    Py_UCS4 *data;
+    Py_ssize_t length;
+    Py_ssize_t allocated;
+} ucs4_buffer;
+
+static int
+ucs4_buffer_reserve(ucs4_buffer *buffer, Py_ssize_t extra)
+{
+    Py_ssize_t allocated;
+    Py_UCS4 *data;
+
+    if (buffer->length + extra <= buffer->allocated) {
+        return 0;
+    }
+    allocated = buffer->allocated * 2;
+    if (allocated < buffer->length + extra) {
+        allocated = buffer->length + extra;
+    }
+    if (allocated < 64) {
+        allocated = 64;
+    }
+    data = PyMem_Realloc(buffer->data, allocated * sizeof(Py_UCS4));
+    if (data == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    buffer->data = data;
+    buffer->allocated = allocated;
+    return 0;
+}
+
+static int
+ucs4_buffer_append_char(ucs4_buffer *buffer, Py_UCS4 ch)
+{
+    if (ucs4_buffer_reserve(buffer, 1) < 0) {
+        return -1;
+    }
+    buffer->data[buffer->length++] = ch;
+    return 0;
+}
+
+static int
+ucs4_buffer_append(ucs4_buffer *buffer, PyObject *str)
+{
+    Py_ssize_t length;
+
+    if (!PyUnicode_Check(str)) {
+        PyErr_Format(PyExc_TypeError, "expected str, not %.100s",
+                     Py_TYPE(str)->tp_name);
+        return -1;
+    }
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(str) < 0) {
+        return -1;
+    }
+#endif
+    length = PyUnicode_GET_LENGTH(str);
+    if (length == 1) {
+        return ucs4_buffer_append_char(buffer, PyUnicode_READ_CHAR(str, 0));
+    }
+    if (length == 0) {
+        return 0;
+    }
+    if (ucs4_buffer_reserve(buffer, length) < 0) {
+        return -1;
+    }
+    if (PyUnicode_AsUCS4(str, buffer->data + buffer->length,
+                         buffer->allocated - buffer->length, 0) == NULL) {
+        return -1;
+    }
+    buffer->length += length;
+    return 0;
+}
+
+/* Growable buffer of bytes used to build the encoded output. */
+typedef struct {
+    char *data;
+    Py_ssize_t length;
+    Py_ssize_t allocated;
+} byte_buffer;
+
+static int
+byte_buffer_append(byte_buffer *buffer, PyObject *item)
+{
+    Py_ssize_t length, allocated;
+    char *data;
+
+    if (!PyBytes_Check(item)) {
+        PyErr_Format(PyExc_TypeError, "expected bytes, not %.100s",
+                     Py_TYPE(item)->tp_name);
+        return -1;
+    }
+    length = PyBytes_GET_SIZE(item);
+    if (buffer->length + length > buffer->allocated) {
+        allocated = buffer->allocated * 2;
+        if (allocated < buffer->length + length) {
+            allocated = buffer->length + length;
+        }
+        if (allocated < 64) {
+            allocated = 64;
+        }
+        data = PyMem_Realloc(buffer->data, allocated);
+        if (data == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        buffer->data = data;
+        buffer->allocated = allocated;
+    }
+    memcpy(buffer->data + buffer->length, PyBytes_AS_STRING(item), length);
+    buffer->length += length;
+    return 0;
+}
+
+/*
+ * Stack of pending items, in the order they were read. Items are emitted from
+ * the top of the stack, so the most recently read is first.
+ */
+typedef struct {
+    PyObject **items;
+    Py_ssize_t length;
+    Py_ssize_t allocated;
+} modifier_stack;
+
+static int
+modifier_stack_push(modifier_stack *stack, PyObject *item)
+{
+    Py_ssize_t allocated;
+    PyObject **items;
+
+    if (stack->length == stack->allocated) {
+        allocated = stack->allocated ? stack->allocated * 2 : 8;
+        items = PyMem_Realloc(stack->items, allocated * sizeof(PyObject *));
+        if (items == NULL) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        stack->items = items;
+        stack->allocated = allocated;
+    }
+    Py_INCREF(item);
+    stack->items[stack->length++] = item;
+    return 0;
+}
+
+static void
+modifier_stack_clear(modifier_stack *stack)
+{
+    while (stack->length > 0) {
+        stack->length--;
+        Py_DECREF(stack->items[stack->length]);
+    }
+}
+
+static void
+modifier_stack_free(modifier_stack *stack)
+{
+    modifier_stack_clear(stack);
+    PyMem_Free(stack->items);
+    stack->items = NULL;
+    stack->allocated = 0;
+}
+
+/* Push the items of a list, given in the order they were read. */
+static int
+modifier_stack_extend(modifier_stack *stack, PyObject *list)
+{
+    Py_ssize_t index;
+
+    for (index = 0; index < PyList_GET_SIZE(list); index++) {
+        if (modifier_stack_push(stack, PyList_GET_ITEM(list, index)) < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+/* Return the stack as a new list, in the order the items were read. */
+static PyObject *
+modifier_stack_to_list(modifier_stack *stack)
+{
+    Py_ssize_t index;
+    PyObject *list = PyList_New(stack->length);
+
+    if (list == NULL) {
+        return NULL;
+    }
+    for (index = 0; index < stack->length; index++) {
+        PyObject *item = stack->items[index];
+        Py_INCREF(item);
+        PyList_SET_ITEM(list, index, item);
+    }
+    return list;
+}
+
+static int
+decode_emit_modifiers(ucs4_buffer *output, modifier_stack *stack)
+{
+    while (stack->length > 0) {
+        PyObject *item = stack->items[stack->length - 1];
+        if (ucs4_buffer_append(output, item) < 0) {
+            return -1;
+        }
+        stack->length--;
+        Py_DECREF(item);
+    }
+    return 0;
+}
+
+/*
+ * Emit the pending modifiers after the character decoded at start. If there
+ * is a composer, the character and its modifiers are replaced by the string
+ * it returns for them.
+ */
+static int
+decode_emit_cluster(ucs4_buffer *output, modifier_stack *stack,
+                    Py_ssize_t start, PyObject *composer)
+{
+    PyObject *cluster, *composed;
+    int status;
+
+    if (stack->length == 0) {
+        return 0;
+    }
+    if (decode_emit_modifiers(output, stack) < 0) {
+        return -1;
+    }
+    if (composer == NULL) {
+        return 0;
+    }
+
+    cluster = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND,
+                                        output->data + start,
+                                        output->length - start);
+    if (cluster == NULL) {
+        return -1;
+    }
+    composed = PyObject_CallFunctionObjArgs(composer, cluster, NULL);
+    Py_DECREF(cluster);
+    if (composed == NULL) {
+        return -1;
+    }
+    if (!PyUnicode_Check(composed)) {
+        PyErr_SetString(PyExc_TypeError, "composer must return str");
+        Py_DECREF(composed);
+        return -1;
+    }
+    output->length = start;
+    status = ucs4_buffer_append(output, composed);
+    Py_DECREF(composed);
+    return status;
+}
+
+/* Call the error handler and return the replacement, a new reference. */
+static PyObject *
+call_error_handler(PyObject *error_handler, PyObject *exc, int decoding)
+{
+    PyObject *result, *replacement;
+
+    result = PyObject_CallFunctionObjArgs(error_handler, exc, NULL);
+    if (result == NULL) {
+        return NULL;
+    }
+    if (!PyTuple_Check(result) || PyTuple_GET_SIZE(result) != 2 ||
+        !PyUnicode_Check(PyTuple_GET_ITEM(result, 0))) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s error handler must return (str, int) tuple",
+                     decoding ? "decoding" : "encoding");
+        Py_DECREF(result);
+        return NULL;
+    }
+    replacement = PyTuple_GET_ITEM(result, 0);
+    Py_INCREF(replacement);
+    Py_DECREF(result);
+    return replacement;
+}
+
+/* Sentinel for table entries that don't decode to a single code point. */
+#define NO_CODE_POINT ((Py_UCS4)-1)
+
+/*
+ * Decode table unpacked into C arrays. Unpacking costs a pass over all 256
+ * entries, so the most recently used tables are cached. The cache holds a
+ * reference to each table, and tables are immutable tuples, so the borrowed
+ * strings in items stay valid for as long as the entry is cached.
+ */
+typedef struct {
+    PyObject *decode_table;
+    int kinds[256];
+    PyObject *items[256];
+    Py_UCS4 code_points[256];
+} parsed_table;
+
+#define PARSED_TABLE_CACHE_SIZE 8
+
+static parsed_table parsed_table_cache[PARSED_TABLE_CACHE_SIZE];
+static int parsed_table_cache_next = 0;
+
+static parsed_table *
+parse_decode_table(PyObject *decode_table)
+{
+    parsed_table *parsed;
+    int index;
+
+    for (index = 0; index < PARSED_TABLE_CACHE_SIZE; index++) {
+        if (parsed_table_cache[index].decode_table == decode_table) {
+            return &parsed_table_cache[index];
+        }
+    }
+    if (PyTuple_GET_SIZE(decode_table) != 256) {
+        PyErr_SetString(PyExc_ValueError, "decode table must have 256 entries");
+        return NULL;
+    }
+
+    parsed = &parsed_table_cache[parsed_table_cache_next];
+    Py_CLEAR(parsed->decode_table);
+    for (index = 0; index < 256; index++) {
+        PyObject *entry = PyTuple_GET_ITEM(decode_table, index);
+        PyObject *item;
+        long kind;
+
+        if (!PyTuple_Check(entry) || PyTuple_GET_SIZE(entry) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "decode table entries must be 2-tuples");
+            return NULL;
+        }
+        kind = PyLong_AsLong(PyTuple_GET_ITEM(entry, 0));
+        if (kind == -1 && PyErr_Occurred()) {
+            return NULL;
+        }
+        item = PyTuple_GET_ITEM(entry, 1);
+        parsed->kinds[index] = (int)kind;
+        parsed->items[index] = item;
+        parsed->code_points[index] = NO_CODE_POINT;
+        if (kind == DECODE_CHAR || kind == DECODE_CONTROL ||
+            kind == DECODE_MODIFIER) {
+            if (!PyUnicode_Check(item)) {
+                PyErr_SetString(PyExc_TypeError,
+                                "decode table strings must be str");
+                return NULL;
+            }
+            if (PyUnicode_GET_LENGTH(item) == 1) {
+                parsed->code_points[index] = PyUnicode_READ_CHAR(item, 0);
+            }
+        }
+    }
+    Py_INCREF(decode_table);
+    parsed->decode_table = decode_table;
+    parsed_table_cache_next =
+        (parsed_table_cache_next + 1) % PARSED_TABLE_CACHE_SIZE;
+    return parsed;
+}
+
+static int
+decode_append(ucs4_buffer *output, parsed_table *parsed, unsigned char item)
+{
+    Py_UCS4 code_point = parsed->code_points[item];
+
+    if (code_point != NO_CODE_POINT &&
+        output->length < output->allocated) {
+        output->data[output->length++] = code_point;
+        return 0;
+    }
+    return ucs4_buffer_append(output, parsed->items[item]);
+}
+
+static PyObject *
+speedups_decode(PyObject *module, PyObject *args)
+{
+    PyObject *name, *decode_table, *passthrough_pattern, *input;
+    PyObject *decoded_modifiers, *error_handler, *composer = NULL;
+    Py_ssize_t max_modifiers;
+    int final;
+    Py_buffer view;
+    const unsigned char *data;
+    Py_ssize_t index;
+    parsed_table *parsed;
+    ucs4_buffer output = {NULL, 0, 0};
+    modifier_stack stack = {NULL, 0, 0};
+    PyObject *decoded = NULL, *pending = NULL, *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "OO!OOO!npO|O:decode", &name, &PyTuple_Type,
+                          &decode_table, &passthrough_pattern, &input,
+                          &PyList_Type, &decoded_modifiers, &max_modifiers,
+                          &final, &error_handler, &composer)) {
+        return NULL;
+    }
+    if (composer == Py_None) {
+        composer = NULL;
+    }
+    parsed = parse_decode_table(decode_table);
+    if (parsed == NULL) {
+        return NULL;
+    }
+    if (PyObject_GetBuffer(input, &view, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    data = (const unsigned char *)view.buf;
+
+    if (modifier_stack_extend(&stack, decoded_modifiers) < 0) {
+        goto error;
+    }
+    if (ucs4_buffer_reserve(&output, view.len) < 0) {
+        goto error;
+    }
+
+    for (index = 0; index < view.len; index++) {
+        unsigned char item = data[index];
+        int kind = parsed->kinds[item];
+        Py_ssize_t start = output.length;
+
+        if (kind == DECODE_CHAR) {
+            if (decode_append(&output, parsed, item) < 0 ||
+                decode_emit_cluster(&output, &stack, start, composer) < 0) {
+                goto error;
+            }
+        }
+        else if (kind == DECODE_MODIFIER && stack.length < max_modifiers) {
+            if (modifier_stack_push(&stack, parsed->items[item]) < 0) {
+                goto error;
+            }
+        }
+        else if (kind == DECODE_CONTROL) {
+            if (stack.length > 0) {
+                if (ucs4_buffer_append_char(&output, ' ') < 0 ||
+                    decode_emit_cluster(&output, &stack, start,
+                                        composer) < 0) {
+                    goto error;
+                }
+            }
+            if (decode_append(&output, parsed, item) < 0) {
+                goto error;
+            }
+        }
+        else {
+            PyObject *exc, *replacement;
+            int status;
+
+            exc = PyObject_CallFunction(PyExc_UnicodeDecodeError, "OOnns",
+                                        name, input, index, index + 1,
+                                        kind == DECODE_MODIFIER
+                                            ? TOO_MANY_MODIFIERS_REASON
+                                            : UNDEFINED_REASON);
+            if (exc == NULL) {
+                goto error;
+            }
+            replacement = call_error_handler(error_handler, exc, 1);
+            Py_DECREF(exc);
+            if (replacement == NULL) {
+                goto error;
+            }
+            status = ucs4_buffer_append(&output, replacement);
+            Py_DECREF(replacement);
+            if (status < 0 ||
+                decode_emit_cluster(&output, &stack, start, composer) < 0) {
+                goto error;
+            }
+            /* The error handler may have decoded with other tables, evicting
+             * this one from the cache. */
+            parsed = parse_decode_table(decode_table);
+            if (parsed == NULL) {
+                goto error;
+            }
+        }
+    }
+
+    if (final && stack.length > 0) {
+        Py_ssize_t start = output.length;
+
+        if (ucs4_buffer_append_char(&output, ' ') < 0 ||
+            decode_emit_cluster(&output, &stack, start, composer) < 0) {
+            goto error;
+        }
+    }
+
+    decoded = PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, output.data,
+                                        output.length);
+    if (decoded == NULL) {
+        goto error;
+    }
+    pending = modifier_stack_to_list(&stack);
+    if (pending == NULL) {
+        goto error;
+    }
+    result = PyTuple_Pack(2, decoded, pending);
+
+error:
+    Py_XDECREF(decoded);
+    Py_XDECREF(pending);
+    modifier_stack_free(&stack);
+    PyMem_Free(output.data);
+    PyBuffer_Release(&view);
+    return result;
+}
+
+/*
+ * Encodings of the Latin-1 characters, looked up in a char map once rather
+ * than on every call. Each entry is a tuple of 256 items, None where the map
+ * has no entry, cached for the most recently used maps. Like the decode
+ * tables, the maps are treated as immutable once in use. A call holds a
+ * reference to its tuple, so it stays valid if the error handler evicts it.
+ */
+#define LATIN1_CACHE_SIZE 8
+
+static PyObject *latin1_cache_maps[LATIN1_CACHE_SIZE];
+static PyObject *latin1_cache_items[LATIN1_CACHE_SIZE];
+static int latin1_cache_next = 0;
+
+/* Return a new reference to the Latin-1 items of the char map. */
+static PyObject *
+lookup_latin1_items(PyObject *encode_char_map)
+{
+    PyObject *items;
+    int index;
+
+    for (index = 0; index < LATIN1_CACHE_SIZE; index++) {
+        if (latin1_cache_maps[index] == encode_char_map) {
+            Py_INCREF(latin1_cache_items[index]);
+            return latin1_cache_items[index];
+        }
+    }
+
+    items = PyTuple_New(256);
+    if (items == NULL) {
+        return NULL;
+    }
+    for (index = 0; index < 256; index++) {
+        PyObject *item, *encoded_item;
+
+        item = PyUnicode_FromOrdinal(index);
+        if (item == NULL) {
+            Py_DECREF(items);
+            return NULL;
+        }
+        encoded_item = PyDict_GetItemWithError(encode_char_map, item);
+        Py_DECREF(item);
+        if (encoded_item == NULL) {
+            if (PyErr_Occurred()) {
+                Py_DECREF(items);
+                return NULL;
+            }
+            encoded_item = Py_None;
+        }
+        Py_INCREF(encoded_item);
+        PyTuple_SET_ITEM(items, index, encoded_item);
+    }
+
+    index = latin1_cache_next;
+    Py_XDECREF(latin1_cache_maps[index]);
+    Py_XDECREF(latin1_cache_items[index]);
+    Py_INCREF(encode_char_map);
+    latin1_cache_maps[index] = encode_char_map;
+    Py_INCREF(items);
+    latin1_cache_items[index] = items;
+    latin1_cache_next = (index + 1) % LATIN1_CACHE_SIZE;
+    return items;
+}
+
+/*
+ * Encoder state shared with recursive calls made for replacements. The
+ * pending character is kept on the stack, its base character at the bottom
+ * followed by its modifiers.
+ */
+typedef struct {
+    PyObject *name;
+    PyObject *encode_char_map;
+    PyObject *encode_modifier_map;
+    PyObject *error_handler;
+    PyObject *decomposer;
+    Py_ssize_t max_modifiers;
+    byte_buffer output;
+    modifier_stack stack;
+    PyObject *latin1_items;
+} encode_state;
+
+static int
+encode_flush(encode_state *state)
+{
+    while (state->stack.length > 0) {
+        PyObject *item = state->stack.items[state->stack.length - 1];
+        if (byte_buffer_append(&state->output, item) < 0) {
+            return -1;
+        }
+        state->stack.length--;
+        Py_DECREF(item);
+    }
+    return 0;
+}
+
+/* Look up a character in the char map, a borrowed reference or NULL. */
+static PyObject *
+encode_lookup_char(encode_state *state, Py_UCS4 code_point)
+{
+    PyObject *item, *encoded_item;
+
+    if (code_point < 256) {
+        encoded_item = PyTuple_GET_ITEM(state->latin1_items, code_point);
+        return encoded_item != Py_None ? encoded_item : NULL;
+    }
+    item = PyUnicode_FromOrdinal(code_point);
+    if (item == NULL) {
+        return NULL;
+    }
+    encoded_item = PyDict_GetItemWithError(state->encode_char_map, item);
+    Py_DECREF(item);
+    return encoded_item;
+}
+
+/*
+ * Encode a character in neither map by its decomposition. Returns 1 if it was
+ * encoded, 0 if it can't be, or -1 with an exception set.
+ */
+static int
+encode_decomposed(encode_state *state, PyObject *item)
+{
+    PyObject *decomposed;
+    Py_ssize_t length;
+    int status = 0;
+
+    decomposed = PyObject_CallFunctionObjArgs(state->decomposer, item, NULL);
+    if (decomposed == NULL) {
+        return -1;
+    }
+    if (decomposed != Py_None) {
+        if (!PyList_Check(decomposed)) {
+            PyErr_SetString(PyExc_TypeError,
+                            "decomposer must return a list or None");
+            status = -1;
+        }
+        else {
+            length = PyList_GET_SIZE(decomposed);
+            if (length > 0 && length <= state->max_modifiers + 1) {
+                if (encode_flush(state) < 0 ||
+                    modifier_stack_extend(&state->stack, decomposed) < 0) {
+                    status = -1;
+                }
+                else {
+                    status = 1;
+                }
+            }
+        }
+    }
+    Py_DECREF(decomposed);
+    return status;
+}
+
+static int
+encode_str(encode_state *state, PyObject *input)
+{
+    Py_ssize_t index, length;
+    int kind;
+    const void *data;
+
+#if PY_VERSION_HEX < 0x030C0000
+    if (PyUnicode_READY(input) < 0) {
+        return -1;
+    }
+#endif
+    length = PyUnicode_GET_LENGTH(input);
+    kind = PyUnicode_KIND(input);
+    data = PyUnicode_DATA(input);
+
+    for (index = 0; index < length; index++) {
+        Py_UCS4 code_point = PyUnicode_READ(kind, data, index);
+        PyObject *item, *encoded_item, *exc, *replacement;
+        int status;
+
+        encoded_item = encode_lookup_char(state, code_point);
+        if (encoded_item != NULL) {
+            if (encode_flush(state) < 0 ||
+                modifier_stack_push(&state->stack, encoded_item) < 0) {
+                return -1;
+            }
+            continue;
+        }
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+
+        item = PyUnicode_FromOrdinal(code_point);
+        if (item == NULL) {
+            return -1;
+        }
+        encoded_item = PyDict_GetItemWithError(state->encode_modifier_map,
+                                               item);
+        if (encoded_item == NULL && !PyErr_Occurred() &&
+            state->decomposer != NULL) {
+            status = encode_decomposed(state, item);
+            Py_DECREF(item);
+            if (status < 0) {
+                return -1;
+            }
+            if (status > 0) {
+                continue;
+            }
+        }
+        else {
+            Py_DECREF(item);
+        }
+        if (encoded_item != NULL &&
+            state->stack.length <= state->max_modifiers) {
+            if (modifier_stack_push(&state->stack, encoded_item) < 0) {
+                return -1;
+            }
+            continue;
+        }
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+
+        exc = PyObject_CallFunction(PyExc_UnicodeEncodeError, "OOnns",
+                                    state->name, input, index, index + 1,
+                                    encoded_item != NULL
+                                        ? TOO_MANY_MODIFIERS_REASON
+                                        : UNDEFINED_REASON);
+        if (exc == NULL) {
+            return -1;
+        }
+        replacement = call_error_handler(state->error_handler, exc, 0);
+        Py_DECREF(exc);
+        if (replacement == NULL) {
+            return -1;
+        }
+        status = encode_str(state, replacement);
+        Py_DECREF(replacement);
+        if (status < 0) {
+            return -1;
+        }
+    }
+    return 0;
+}
+
+static PyObject *
+speedups_encode(PyObject *module, PyObject *args)
+{
+    PyObject *passthrough_pattern, *input, *current_char;
+    PyObject *encoded = NULL, *pending = NULL, *result = NULL;
+    int final;
+    encode_state state;
+
+    memset(&state, 0, sizeof(state));
+    if (!PyArg_ParseTuple(args, "OO!O!OUO!npO|O:encode", &state.name,
+                          &PyDict_Type, &state.encode_char_map, &PyDict_Type,
+                          &state.encode_modifier_map, &passthrough_pattern,
+                          &input, &PyList_Type, &current_char,
+                          &state.max_modifiers, &final, &state.error_handler,
+                          &state.decomposer)) {
+        return NULL;
+    }
+    if (state.decomposer == Py_None) {
+        state.decomposer = NULL;
+    }
+    state.latin1_items = lookup_latin1_items(state.encode_char_map);
+    if (state.latin1_items == NULL) {
+        return NULL;
+    }
+    if (modifier_stack_extend(&state.stack, current_char) < 0) {
+        goto error;
+    }
+
+    if (encode_str(&state, input) < 0) {
+        goto error;
+    }
+    if (final && encode_flush(&state) < 0) {
+        goto error;
+    }
+
+    encoded = PyBytes_FromStringAndSize(state.output.data,
+                                        state.output.length);
+    if (encoded == NULL) {
+        goto error;
+    }
+    pending = modifier_stack_to_list(&state.stack);
+    if (pending == NULL) {
+        goto error;
+    }
+    result = PyTuple_Pack(2, encoded, pending);
+
+error:
+    Py_XDECREF(encoded);
+    Py_XDECREF(pending);
+    Py_DECREF(state.latin1_items);
+    modifier_stack_free(&state.stack);
+    PyMem_Free(state.output.data);
+    return result;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"decode", speedups_decode, METH_VARARGS,
+     "decode(name, decode_table, passthrough_pattern, input, "
+     "decoded_modifiers, max_modifiers, final, error_handler, "
+     "composer=None)\n--\n\n"
+     "Decode input, returning the decoded string and the pending modifiers."},
+    {"encode", speedups_encode, METH_VARARGS,
+     "encode(name, encode_char_map, encode_modifier_map, passthrough_pattern, "
+     "input, current_char, max_modifiers, final, error_handler, "
+     "decomposer=None)\n--\n\n"
+     "Encode input, returning the encoded bytes and the pending character."},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "ansel._speedups",
+    "C implementation of the ANSEL decoder and encoder state machines.",
+    -1,
+    speedups_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    return PyModule_Create(&speedups_module);
+}
@@ -0,0 +1,149 @@
+"""Decoding and encoding of asyncio streams."""
+import asyncio
+
+from .codec import LINE, READ_SIZE
+from .encodings import lookup
+
+OFFLOAD_SIZE = 1 << 16
+
+
+class AnselStreamReader:
+    """Read decoded text from an :py:class:`asyncio.StreamReader`.
+
+    Bytes are decoded with an incremental decoder as they arrive, so modifiers
+    at the end of one read are combined with the character read after them.
+    If an executor is given, reads of at least offload_size bytes are decoded
+    in it rather than in the event loop. The decoder is only ever used by one
+    read at a time, so a :py:class:`concurrent.futures.ThreadPoolExecutor`
+    is suitable.
+    """
+
+    def __init__(
+        self,
+        reader,
+        encoding="gedcom",
+        errors="strict",
+        executor=None,
+        offload_size=OFFLOAD_SIZE,
+    ):
+        self.reader = reader
+        self.decoder = lookup(encoding).incrementaldecoder(errors)
+        self.executor = executor
+        self.offload_size = offload_size
+        # Text decoded by readline but not yet returned.
+        self.text = ""
+        self.text_position = 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        line = await self.readline()
+        if not line:
+            raise StopAsyncIteration
+        return line
+
+    async def decode(self, data, final=False):
+        if self.executor is not None and len(data) >= self.offload_size:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(
+                self.executor, self.decoder.decode, data, final
+            )
+        return self.decoder.decode(data, final)
+
+    def take_text(self, end):
+        """Remove and return the text kept by readline up to end."""
+        start = self.text_position
+        text = self.text[start:end]
+        if end < len(self.text):
+            self.text_position = end
+        else:
+            self.text = ""
+            self.text_position = 0
+        return text
+
+    async def read(self, n=-1):
+        """Read up to n bytes, or until EOF if n is -1, and return their text.
+
+        Text already decoded by readline is returned first. Returns an empty
+        string only at EOF or if n is 0, reading on if the bytes read were all
+        modifiers.
+        """
+        if n == 0:
+            return ""
+        if self.text:
+            text = self.take_text(len(self.text))
+            if n < 0:
+                text += await self.read()
+            return text
+        while True:
+            data = await self.reader.read(n)
+            text = await self.decode(data, final=self.reader.at_eof())
+            if text or not data:
+                return text
+
+    async def readline(self):
+        """Read and return one line of text, or an empty string at EOF.
+
+        Lines end with CR, LF or CR LF, like those of GEDCOM files. The stream
+        is read READ_SIZE bytes at a time, and text after the line is kept for
+        the next read.
+        """
+        at_eof = False
+        while True:
+            match = LINE.match(self.text, self.text_position)
+            # A CR at the end of the text may be followed by a LF.
+            if match is not None and (
+                at_eof or match.end() < len(self.text) or self.text[-1] != "\r"
+            ):
+                return self.take_text(match.end())
+            if at_eof:
+                return self.take_text(len(self.text))
+            data = await self.reader.read(READ_SIZE)
+            at_eof = not data
+            text = await self.decode(data, final=at_eof)
+            self.text = self.take_text(len(self.text)) + text
+
+    def at_eof(self):
+        return not self.text and self.reader.at_eof()
+
+
+class AnselStreamWriter:
+    """Write encoded text to an :py:class:`asyncio.StreamWriter`.
+
+    Text is encoded with an incremental encoder, so combining characters in
+    one write are encoded with the character written before them. The last
+    character written is held by the encoder until more text is written, or
+    close or flush is called.
+    """
+
+    def __init__(self, writer, encoding="gedcom", errors="strict"):
+        self.writer = writer
+        self.encoder = lookup(encoding).incrementalencoder(errors)
+
+    def write(self, text):
+        data = self.encoder.encode(text)
+        if data:
+            self.writer.write(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        """Write the character held by the encoder."""
+        data = self.encoder.encode("", final=True)
+        if data:
+            self.writer.write(data)
+
+    async def drain(self):
+        await self.writer.drain()
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+    async def wait_closed(self):
+        # StreamWriter.wait_closed was added in Python 3.7.
+        if hasattr(self.writer, "wait_closed"):
+            await self.writer.wait_closed()
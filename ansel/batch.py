@@ -0,0 +1,80 @@
+"""Decoding and encoding of many short values."""
+import codecs
+
+from . import incremental
+from .encodings import lookup
+
+
+def decode_many(inputs, encoding="gedcom", errors="strict"):
+    """Decode each bytes-like object in inputs, returning a list of str.
+
+    The codec and error handler are looked up once, and each input is decoded
+    with a single call to the decoder state machine, so decoding many short
+    values costs little more than their translation. Each input is decoded
+    independently, as if by :py:func:`codecs.decode`.
+    """
+    codec_info = lookup(encoding)
+    decoder_class = codec_info.incrementaldecoder
+    if not issubclass(decoder_class, incremental.IncrementalDecoder):
+        decode = codec_info.decode
+        return [decode(input, errors)[0] for input in inputs]
+
+    decode = incremental.decode
+    as_bytes = incremental.as_bytes
+    name = decoder_class.name
+    decode_table = decoder_class.decode_table
+    passthrough_pattern = decoder_class.passthrough_pattern
+    max_modifiers = decoder_class.max_modifiers
+    error_handler = codecs.lookup_error(errors)
+    composer = incremental.get_composer(decoder_class.normalize)
+    return [
+        decode(
+            name,
+            decode_table,
+            passthrough_pattern,
+            as_bytes(input),
+            [],
+            max_modifiers,
+            True,
+            error_handler,
+            composer,
+        )[0]
+        for input in inputs
+    ]
+
+
+def encode_many(inputs, encoding="gedcom", errors="strict"):
+    """Encode each str in inputs, returning a list of bytes.
+
+    This is the counterpart of :py:func:`decode_many`. Each input is encoded
+    independently, as if by :py:func:`codecs.encode`.
+    """
+    codec_info = lookup(encoding)
+    encoder_class = codec_info.incrementalencoder
+    if not issubclass(encoder_class, incremental.IncrementalEncoder):
+        encode = codec_info.encode
+        return [encode(input, errors)[0] for input in inputs]
+
+    encode = incremental.encode
+    name = encoder_class.name
+    encode_char_map = encoder_class.encode_char_map
+    encode_modifier_map = encoder_class.encode_modifier_map
+    passthrough_pattern = encoder_class.passthrough_pattern
+    max_modifiers = encoder_class.max_modifiers
+    error_handler = codecs.lookup_error(errors)
+    decomposer = encoder_class.decomposer if encoder_class.decompose else None
+    return [
+        encode(
+            name,
+            encode_char_map,
+            encode_modifier_map,
+            passthrough_pattern,
+            input,
+            [],
+            max_modifiers,
+            True,
+            error_handler,
+            decomposer,
+        )[0]
+        for input in inputs
+    ]
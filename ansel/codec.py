@@ -1,27 +1,354 @@
+"""The codec and stream classes the encodings of ansel.encodings are built on."""
 import codecs
+import io
+import re
 
-from .incremental import IncrementalDecoder, IncrementalEncoder
+from . import incremental
+from .incremental import IncrementalDecoder, IncrementalEncoder, as_bytes
+
+READ_SIZE = 1 << 16
+
+# A line ending with any of CR, LF or CR LF, as GEDCOM lines do.
+LINE = re.compile(r"[^\r\n]*(?:\r\n?|\n)")
+
+# The line boundaries str.splitlines recognizes besides CR and LF. Text
+# without them is split with str.splitlines, which is faster than LINE.
+OTHER_LINE_BOUNDARY = re.compile("[\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# The attributes of Codec the incremental and stream classes are derived from.
+MAP_ATTRIBUTES = (
+    "name",
+    "encode_char_map",
+    "encode_modifier_map",
+    "decode_char_map",
+    "decode_control_map",
+    "decode_modifier_map",
+    "decode_table",
+)
+
+
+def derive_class(codec_class, name, bases, attributes=None):
+    """Return the class name derived for codec_class.
+
+    The class belongs to the module of codec_class, where the encoding modules
+    bind it to the same name, so its instances can be pickled.
+    """
+    attributes = dict(attributes or {})
+    attributes["__module__"] = codec_class.__module__
+    attributes["__qualname__"] = name
+    return type(name, bases, attributes)
 
 
 class Codec(codecs.Codec):
+    """A codec for the character set defined by the maps.
+
+    A subclass setting the maps is a complete codec, since the incremental and
+    stream classes are derived from it. :py:meth:`codec_info` returns its
+    entry for the :py:mod:`codecs` registry.
+    """
+
     name = None
     encode_char_map = {}
     encode_modifier_map = {}
     decode_char_map = {}
     decode_control_map = {}
     decode_modifier_map = {}
+    decode_table = None
+    incrementalencoder = IncrementalEncoder
+    incrementaldecoder = IncrementalDecoder
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Derive the incremental and stream classes once, so the lookup tables
+        # they precompute are shared by every call to encode and decode.
+        # Subclasses that don't change the maps, like the stream classes,
+        # share them too.
+        if not any(attribute in cls.__dict__ for attribute in MAP_ATTRIBUTES):
+            return
+        cls.incrementalencoder = derive_class(
+            cls,
+            "IncrementalEncoder",
+            (IncrementalEncoder,),
+            {
+                "name": cls.name,
+                "encode_char_map": cls.encode_char_map,
+                "encode_modifier_map": cls.encode_modifier_map,
+            },
+        )
+        decoder_attributes = {
+            "name": cls.name,
+            "decode_char_map": cls.decode_char_map,
+            "decode_control_map": cls.decode_control_map,
+            "decode_modifier_map": cls.decode_modifier_map,
+        }
+        # A prebuilt decode table is only used by the class defining it, a
+        # subclass changing the maps needs a table built from them.
+        if "decode_table" in cls.__dict__:
+            decoder_attributes["decode_table"] = cls.decode_table
+        cls.incrementaldecoder = derive_class(
+            cls, "IncrementalDecoder", (IncrementalDecoder,), decoder_attributes
+        )
+        cls.streamreader = derive_class(cls, "StreamReader", (cls, StreamReader))
+        cls.streamwriter = derive_class(cls, "StreamWriter", (cls, StreamWriter))
+
+    @classmethod
+    def codec_info(cls):
+        """Return the :py:class:`codecs.CodecInfo` of the codec."""
+        instance = cls()
+        return codecs.CodecInfo(
+            name=cls.name,
+            encode=instance.encode,
+            decode=instance.decode,
+            incrementalencoder=cls.incrementalencoder,
+            incrementaldecoder=cls.incrementaldecoder,
+            streamreader=cls.streamreader,
+            streamwriter=cls.streamwriter,
+        )
 
     def encode(self, input, errors="strict"):
-        encoder = IncrementalEncoder(errors)
-        encoder.name = self.name
-        encoder.encode_char_map = self.encode_char_map
-        encoder.encode_modifier_map = self.encode_modifier_map
-        return encoder.encode(input, final=True), len(input)
+        # Call the encoder state machine directly rather than through an
+        # incremental encoder, which would be created and discarded per call.
+        encoder = self.incrementalencoder
+        encoded, _ = incremental.encode(
+            encoder.name,
+            encoder.encode_char_map,
+            encoder.encode_modifier_map,
+            encoder.passthrough_pattern,
+            input,
+            [],
+            encoder.max_modifiers,
+            True,
+            codecs.lookup_error(errors),
+            encoder.decomposer if encoder.decompose else None,
+        )
+        return encoded, len(input)
 
     def decode(self, input, errors="strict"):
-        decoder = IncrementalDecoder(errors)
-        decoder.name = self.name
-        decoder.decode_char_map = self.decode_char_map
-        decoder.decode_control_map = self.decode_control_map
-        decoder.decode_modifier_map = self.decode_modifier_map
-        return decoder.decode(input, final=True), len(input)
+        input = as_bytes(input)
+        decoder = self.incrementaldecoder
+        decoded, _ = incremental.decode(
+            decoder.name,
+            decoder.decode_table,
+            decoder.passthrough_pattern,
+            input,
+            [],
+            decoder.max_modifiers,
+            True,
+            codecs.lookup_error(errors),
+            incremental.get_composer(decoder.normalize),
+        )
+        return decoded, len(input)
+
+
+def is_appending(stream):
+    """Return whether writes to stream always go to its end."""
+    mode = getattr(stream, "mode", "")
+    return isinstance(mode, str) and "a" in mode
+
+
+def can_rewrite(stream):
+    """Return whether bytes just written to stream can be sought back over.
+
+    The stream must be seekable and not opened for appending. Streams with a
+    mode that isn't a str, like :py:class:`gzip.GzipFile`, may claim to be
+    seekable but refuse to seek backwards.
+    """
+    if not isinstance(getattr(stream, "mode", ""), str) or is_appending(stream):
+        return False
+    try:
+        return stream.seekable()
+    except (AttributeError, ValueError):
+        return False
+
+
+class StreamWriter(codecs.StreamWriter):
+    """Write text to a stream, with combining characters split across writes.
+
+    The last character written, and its combining characters, are held by an
+    incremental encoder since combining characters written later are encoded
+    before it. At most that one character is held, never the whole output.
+
+    For seekable streams the held character is also written straight away,
+    and rewritten if combining characters follow it, so the stream is
+    complete however it's closed. For other streams it's written by reset,
+    close or leaving a with statement. Streams opened for appending can't be
+    rewritten, and :py:func:`codecs.open` closes them without closing the
+    writer, so each write to them is encoded completely instead.
+    """
+
+    incrementalencoder = IncrementalEncoder
+
+    def __init__(self, stream, errors="strict"):
+        super().__init__(stream, errors)
+        self.encoder = self.incrementalencoder(errors)
+        self.write_ahead = can_rewrite(stream)
+        self.hold = not is_appending(stream)
+        self.written_ahead = 0
+
+    def write(self, object):
+        if not object:
+            return
+        if not self.write_ahead:
+            data = self.encoder.encode(object, final=not self.hold)
+            if data:
+                self.stream.write(data)
+            return
+        if self.written_ahead:
+            if object[0] in self.encoder.encode_modifier_map:
+                self.stream.seek(-self.written_ahead, io.SEEK_CUR)
+            else:
+                self.encoder.reset()
+            self.written_ahead = 0
+        data = self.encoder.encode(object)
+        held = b"".join(reversed(self.encoder.current_char))
+        self.written_ahead = len(held)
+        self.stream.write(data + held)
+
+    def reset(self):
+        data = self.encoder.encode("", final=True)
+        if data and not self.written_ahead:
+            self.stream.write(data)
+        self.written_ahead = 0
+
+    def close(self):
+        self.reset()
+        self.stream.close()
+
+    def __exit__(self, type, value, tb):
+        self.close()
+
+
+class StreamReader(codecs.StreamReader):
+    """Read text from a stream, with combining characters split across reads.
+
+    Bytes are decoded with an incremental decoder, READ_SIZE bytes at a time
+    unless a size is given. Decoded text is split into lines a chunk at a time,
+    and lines are returned from that list, so iterating over lines costs
+    little more than reading the whole stream. Lines end with CR, LF or CR LF.
+    """
+
+    incrementaldecoder = IncrementalDecoder
+
+    def __init__(self, stream, errors="strict"):
+        super().__init__(stream, errors)
+        self.decoder = self.incrementaldecoder(errors)
+        self.text = ""
+        self.text_position = 0
+        self.lines = []
+        self.line_index = 0
+
+    def __iter__(self):
+        while True:
+            lines = self.lines
+            for index in range(self.line_index + 1, len(lines) + 1):
+                self.line_index = index
+                yield lines[index - 1]
+                # Start over if the lines were read some other way meanwhile.
+                if self.line_index != index or self.lines is not lines:
+                    break
+            else:
+                line = self.readline()
+                if not line:
+                    return
+                yield line
+
+    def __next__(self):
+        index = self.line_index
+        if index < len(self.lines):
+            self.line_index = index + 1
+            return self.lines[index]
+        line = self.readline()
+        if line:
+            return line
+        raise StopIteration
+
+    def fill(self, size=-1):
+        """Read and decode more of the stream, returning False at its end."""
+        data = self.stream.read(size) if size >= 0 else self.stream.read()
+        # Reading no bytes only means the end of the stream if some were asked
+        # for, reading 0 bytes returns none either way.
+        decoded = self.decoder.decode(data, final=not data and size != 0)
+        if decoded:
+            start = self.text_position
+            self.text = self.text[start:] + decoded
+            self.text_position = 0
+        return bool(data)
+
+    def split_lines(self, at_end):
+        """Move the complete lines from the text to the list of lines."""
+        start = self.text_position
+        text = self.text[start:]
+        if OTHER_LINE_BOUNDARY.search(text):
+            lines = LINE.findall(text)
+        else:
+            lines = text.splitlines(True)
+            # The last line is only complete if it ends with a line break.
+            if lines and lines[-1][-1] not in "\r\n":
+                lines.pop()
+        # A CR at the end of the text may be followed by a LF.
+        if lines and not at_end and text.endswith("\r"):
+            lines.pop()
+        self.lines = lines
+        self.line_index = 0
+        consumed = sum(map(len, lines))
+        self.text = text[consumed:]
+        self.text_position = 0
+
+    def join_lines(self):
+        """Move the lines not yet read back to the start of the text."""
+        index = self.line_index
+        if index < len(self.lines):
+            start = self.text_position
+            self.text = "".join(self.lines[index:]) + self.text[start:]
+            self.text_position = 0
+        self.lines = []
+        self.line_index = 0
+
+    def read(self, size=-1, chars=-1, firstline=False):
+        if chars == 0 or (chars < 0 and size == 0):
+            return ""
+        self.join_lines()
+        # Returns an empty string only at the end of the stream, even if the
+        # bytes read were all modifiers held by the decoder.
+        while True:
+            available = len(self.text) - self.text_position
+            if chars >= 0 and available >= chars:
+                break
+            if chars < 0 and size >= 0 and available:
+                break
+            if not self.fill(size):
+                break
+
+        start = self.text_position
+        end = len(self.text)
+        if 0 <= chars < end - start:
+            end = start + chars
+        self.text_position = end
+        return self.text[start:end]
+
+    def readline(self, size=None, keepends=True):
+        if not size or size < 0:
+            size = READ_SIZE
+        if self.line_index == len(self.lines) and self.text_position < len(self.text):
+            self.split_lines(False)
+        while self.line_index == len(self.lines):
+            at_end = not self.fill(size)
+            self.split_lines(at_end)
+            if at_end:
+                break
+
+        if self.line_index < len(self.lines):
+            line = self.lines[self.line_index]
+            self.line_index += 1
+        else:
+            start = self.text_position
+            line = self.text[start:]
+            self.text_position = len(self.text)
+        return line if keepends else line.rstrip("\r\n")
+
+    def reset(self):
+        self.decoder.reset()
+        self.text = ""
+        self.text_position = 0
+        self.lines = []
+        self.line_index = 0
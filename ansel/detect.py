@@ -0,0 +1,122 @@
+"""Detection of the character set of GEDCOM files."""
+import codecs
+import io
+import os
+import re
+
+from . import encodings
+
+PEEK_SIZE = 1 << 12
+MAX_PEEK_SIZE = 1 << 16
+
+# The HEAD.CHAR line, and the start of the record after HEAD which ends the
+# search for it.
+CHAR_LINE = re.compile(rb"[\r\n][ \t]*1[ \t]+CHAR[ \t]+([^\r\n]*)")
+NEXT_RECORD = re.compile(rb"[\r\n][ \t]*0[ \t]")
+
+CHARSETS = {
+    "ANSEL": "gedcom",
+    "ANSI": "cp1252",
+    "ASCII": "ascii",
+    "IBMPC": "cp437",
+    "MACINTOSH": "mac_roman",
+    "UNICODE": "utf-16",
+    "UTF-16": "utf-16",
+    "UTF-8": "utf-8",
+    "UTF8": "utf-8",
+}
+
+BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+
+def detect_encoding(data, default="gedcom"):
+    """Return the name of the encoding of the GEDCOM file starting with data.
+
+    A byte order mark takes precedence, then UTF-16 without one is recognized
+    by its zero bytes. Otherwise the value of the HEAD.CHAR line is used,
+    where data must include the HEAD record up to that line. If there is no
+    such line, or its value isn't a known character set, default is returned.
+    """
+    for bom, encoding in BOMS:
+        if data.startswith(bom):
+            return encoding
+    if data[:2] == b"0\x00":
+        return "utf-16-le"
+    if data[:2] == b"\x000":
+        return "utf-16-be"
+
+    match = NEXT_RECORD.search(data)
+    if match is not None:
+        data = data[: match.start()]
+    match = CHAR_LINE.search(data)
+    if match is None:
+        return default
+    charset = match.group(1).strip().decode("ascii", "replace").upper()
+    return CHARSETS.get(charset, default)
+
+
+class PrefixedStream(io.RawIOBase):
+    """A raw stream that reads prefix, then the rest of fileobj."""
+
+    def __init__(self, prefix, fileobj):
+        super().__init__()
+        self.prefix = prefix
+        self.fileobj = fileobj
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        size = len(b)
+        if self.prefix:
+            data = self.prefix[:size]
+            self.prefix = self.prefix[size:]
+        else:
+            data = self.fileobj.read(size)
+        size = len(data)
+        b[:size] = data
+        return size
+
+    def close(self):
+        if not self.closed:
+            self.fileobj.close()
+        super().close()
+
+
+def open_gedcom(file, errors="strict", newline=None, default="gedcom"):
+    """Open a GEDCOM file for reading text, detecting its character set.
+
+    file is a path or a binary file object. The start of the file, up to the
+    end of the HEAD record, is read to detect the encoding as
+    :py:func:`detect_encoding` does, then replayed to the decoder, so the file
+    is read once and needn't be seekable. Returns an :py:class:`io.TextIOWrapper`,
+    whose encoding attribute is the detected encoding.
+
+    The encodings provided by this package are registered with
+    :py:mod:`codecs` if they aren't already, as :py:class:`io.TextIOWrapper`
+    requires.
+    """
+    if isinstance(file, (str, bytes, os.PathLike)):
+        file = open(file, "rb")
+
+    prefix = b""
+    while len(prefix) < MAX_PEEK_SIZE:
+        data = file.read(PEEK_SIZE)
+        if not data:
+            break
+        prefix += data
+        # Stop once the record after HEAD has started.
+        if NEXT_RECORD.search(prefix):
+            break
+
+    encodings.register()
+    return io.TextIOWrapper(
+        io.BufferedReader(PrefixedStream(prefix, file)),
+        encoding=detect_encoding(prefix, default),
+        errors=errors,
+        newline=newline,
+    )
@@ -0,0 +1,107 @@
+import codecs
+import importlib
+import re
+
+# The module providing each encoding. They are imported on first lookup, so
+# importing the package doesn't build codecs that may never be used.
+MODULES = {"ansel": ".ansel", "gedcom": ".gedcom", "marc8": ".marc8"}
+
+# The names of dialects, which are also their section names in the format of
+# tables.txt. codecs looks up names in lower case.
+DIALECT_NAME = re.compile(r"[a-z0-9_]+$")
+
+registered = False
+codec_infos = {}
+# The (name, definition, base) of each dialect, from which it can be defined
+# again in other processes.
+dialect_definitions = {}
+
+
+def search_function(encoding):
+    codec_info = codec_infos.get(encoding)
+    if codec_info is None and encoding in MODULES:
+        module = importlib.import_module(MODULES[encoding], __name__)
+        codec_info = codec_infos[encoding] = module.getregentry()
+    return codec_info
+
+
+def register():
+    """Register search_function with :py:mod:`codecs`, unless already done."""
+    global registered
+    if not registered:
+        codecs.register(search_function)
+        registered = True
+
+
+def lookup(encoding):
+    """Look up the codec info for encoding.
+
+    The encodings provided by this package are found whether or not
+    :func:`ansel.register` has been called, any other encoding is looked up in
+    the :py:mod:`codecs` registry.
+    """
+    codec_info = search_function(encoding)
+    if codec_info is None:
+        codec_info = codecs.lookup(encoding)
+    return codec_info
+
+
+def define_dialect(name, definition, base="gedcom"):
+    """Define the encoding name, a dialect of the encoding base.
+
+    definition is a str, or an iterable of lines, mapping the bytes that
+    differ from base in the format of ansel/encodings/tables.txt, for example
+    ``"0xBE  U+2610  char  # BALLOT BOX"``. base is an encoding of this
+    package, or another dialect. The dialect is compiled once into the same
+    tables the encodings of this package use, and is then found by
+    :py:func:`lookup`, and by :py:mod:`codecs` once registered. Returns its
+    codec info.
+
+    Raises :py:exc:`ValueError` if name isn't lower case letters, digits and
+    underscores, or is already an encoding, or the definition is invalid.
+    """
+    if not DIALECT_NAME.match(name):
+        raise ValueError("invalid dialect name {!r}".format(name))
+    try:
+        lookup(name)
+    except LookupError:
+        pass
+    else:
+        raise ValueError("encoding {!r} is already defined".format(name))
+    base_info = search_function(base)
+    if base_info is None:
+        raise ValueError("unknown base encoding {!r}".format(base))
+    if isinstance(definition, str):
+        definition = definition.splitlines()
+    definition = tuple(definition)
+
+    # Imported here since the generator is only needed to define dialects.
+    from . import dialects
+
+    codec_class = dialects.compile_dialect(name, definition, base_info)
+    codec_info = codec_infos[name] = codec_class.codec_info()
+    dialect_definitions[name] = (name, definition, base)
+    return codec_info
+
+
+def get_dialect_definitions(encoding):
+    """Return the definitions needed to define encoding in another process.
+
+    Returns a list of (name, definition, base) for encoding, if it's a dialect,
+    and the dialects it's based on, bases first.
+    """
+    definitions = []
+    while encoding in dialect_definitions:
+        definitions.append(dialect_definitions[encoding])
+        encoding = dialect_definitions[encoding][2]
+    return definitions[::-1]
+
+
+def define_dialects(definitions):
+    """Define each dialect of definitions that isn't already defined.
+
+    definitions is a list returned by :py:func:`get_dialect_definitions`.
+    """
+    for name, definition, base in definitions:
+        if name not in codec_infos:
+            define_dialect(name, definition, base)
@@ -0,0 +1,59 @@
+"""Compilation of dialects defined at runtime.
+
+A dialect is defined by the mappings, in the format of tables.txt, that differ
+from an encoding of this package. It's compiled by the same functions that
+generate _tables.py, into a codec using the same engine as the generated
+encodings.
+"""
+from .. import codec
+from ..incremental import DECODE_CHAR, DECODE_CONTROL, DECODE_MODIFIER
+from . import generate
+
+
+def base_mappings(codec_info):
+    """Return the {byte: Mapping} dict of the character set of codec_info."""
+    decoder_class = codec_info.incrementaldecoder
+    encoder_class = codec_info.incrementalencoder
+    char_map = encoder_class.encode_char_map
+    modifier_map = encoder_class.encode_modifier_map
+    mappings = {}
+    for kind, decode_map, encode_map in [
+        (DECODE_CONTROL, decoder_class.decode_control_map, char_map),
+        (DECODE_CHAR, decoder_class.decode_char_map, char_map),
+        (DECODE_MODIFIER, decoder_class.decode_modifier_map, modifier_map),
+    ]:
+        for byte, char in decode_map.items():
+            # A byte is decode-only if its character is encoded by another.
+            decode_only = encode_map.get(char) != bytes([byte])
+            mappings[byte] = generate.Mapping(byte, char, kind, decode_only, "", None)
+    return mappings
+
+
+def compile_dialect(name, definition, base_info):
+    """Return a Codec subclass for the dialect name of the encoding base_info.
+
+    definition is a sequence of lines of mappings in the format of tables.txt,
+    numbered from 1 in any error.
+    """
+    base = base_info.name
+    header = "[{}: {}]".format(name, base)
+    charsets = generate.parse(
+        [header] + list(definition), {base: base_mappings(base_info)}, start=0
+    )
+    if list(charsets) != [name]:
+        raise ValueError("a dialect definition can't start other sections")
+
+    tables = generate.build_tables(charsets[name])
+    return type(
+        "Codec",
+        (codec.Codec,),
+        {
+            "name": name,
+            "encode_char_map": tables.encode_char_map,
+            "encode_modifier_map": tables.encode_modifier_map,
+            "decode_char_map": tables.decode_char_map,
+            "decode_control_map": tables.decode_control_map,
+            "decode_modifier_map": tables.decode_modifier_map,
+            "decode_table": tables.decode_table,
+        },
+    )
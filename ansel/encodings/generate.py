@@ -0,0 +1,357 @@
+"""Generate _tables.py from the character set definitions in tables.txt.
+
+Run ``python -m ansel.encodings.generate`` after changing tables.txt, or with
+``--check`` to only report whether _tables.py is up to date. Building the
+package runs it too.
+
+Only the byte mappings of each character set are defined, the encodings of
+precomposed characters are derived from their canonical decompositions. The
+generated tables are checked for consistency, and any error in tables.txt is
+reported as a :py:exc:`ValueError` naming its line.
+"""
+import argparse
+import codecs
+import collections
+import functools
+import os
+import re
+import sys
+import unicodedata
+
+from .. import incremental
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+SOURCE = os.path.join(DIRECTORY, "tables.txt")
+TARGET = os.path.join(DIRECTORY, "_tables.py")
+
+SECTION = re.compile(r"\[(\w+)(?:\s*:\s*(\w+))?\]$")
+MAPPING = re.compile(
+    r"0x([0-9A-F]{2})\s+U\+([0-9A-F]{4,6})\s+(control|char|modifier)"
+    r"(\s+decode-only)?$"
+)
+
+KINDS = {
+    "control": incremental.DECODE_CONTROL,
+    "char": incremental.DECODE_CHAR,
+    "modifier": incremental.DECODE_MODIFIER,
+}
+KIND_NAMES = {
+    incremental.DECODE_CHAR: "DECODE_CHAR",
+    incremental.DECODE_CONTROL: "DECODE_CONTROL",
+    incremental.DECODE_MODIFIER: "DECODE_MODIFIER",
+}
+
+HEADER = '''"""Character set tables, generated from tables.txt by generate.py.
+
+Don't edit this module, change tables.txt and run
+``python -m ansel.encodings.generate`` instead.
+"""
+from .. import incremental
+
+DECODE_CHAR = incremental.DECODE_CHAR
+DECODE_CONTROL = incremental.DECODE_CONTROL
+DECODE_MODIFIER = incremental.DECODE_MODIFIER
+DECODE_UNDEFINED = incremental.DECODE_UNDEFINED
+'''
+
+Mapping = collections.namedtuple(
+    "Mapping", ["byte", "char", "kind", "decode_only", "name", "line"]
+)
+
+Tables = collections.namedtuple(
+    "Tables",
+    [
+        "decode_control_map",
+        "decode_char_map",
+        "decode_modifier_map",
+        "encode_char_map",
+        "encode_modifier_map",
+        "decode_table",
+        "names",
+    ],
+)
+
+
+def parse(lines, bases=None, start=1):
+    """Parse the lines of tables.txt into a dict of {byte: Mapping} per section.
+
+    bases is a dict of the {byte: Mapping} dicts of other character sets,
+    which sections may be based on too. Lines are numbered from start.
+    """
+    bases = bases or {}
+    charsets = {}
+    mappings = None
+    for line_number, line in enumerate(lines, start):
+        line, _, name = line.partition("#")
+        line = line.strip()
+        if not line:
+            continue
+
+        match = SECTION.match(line)
+        if match is not None:
+            charset, base = match.groups()
+            if charset in charsets or charset in bases:
+                raise ValueError(
+                    "line {}: duplicate section {!r}".format(line_number, charset)
+                )
+            if base is None:
+                mappings = {}
+            elif base in charsets:
+                mappings = dict(charsets[base])
+            elif base in bases:
+                mappings = dict(bases[base])
+            else:
+                raise ValueError(
+                    "line {}: unknown base section {!r}".format(line_number, base)
+                )
+            charsets[charset] = mappings
+            defined = set()
+            continue
+
+        match = MAPPING.match(line)
+        if match is None:
+            raise ValueError("line {}: invalid mapping {!r}".format(line_number, line))
+        if mappings is None:
+            raise ValueError("line {}: mapping outside a section".format(line_number))
+        byte = int(match.group(1), 16)
+        if byte in defined:
+            raise ValueError(
+                "line {}: byte 0x{:02X} is already mapped".format(line_number, byte)
+            )
+        defined.add(byte)
+        mappings[byte] = Mapping(
+            byte,
+            chr(int(match.group(2), 16)),
+            KINDS[match.group(3)],
+            match.group(4) is not None,
+            name.strip(),
+            line_number,
+        )
+    return charsets
+
+
+def check_mapping(mapping):
+    category = unicodedata.category(mapping.char)
+    if mapping.kind == incremental.DECODE_MODIFIER and category != "Mn":
+        error = "is not a combining character"
+    elif mapping.kind != incremental.DECODE_MODIFIER and category == "Mn":
+        error = "is a combining character, which must be a modifier"
+    elif mapping.kind == incremental.DECODE_CONTROL and category != "Cc":
+        error = "is not a control character"
+    else:
+        return
+    raise ValueError(
+        "line {}: U+{:04X} {}".format(mapping.line, ord(mapping.char), error)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def decompositions():
+    """Return each character with a canonical decomposition, and its NFD."""
+    result = []
+    for code_point in range(sys.maxunicode + 1):
+        char = chr(code_point)
+        decomposition = unicodedata.decomposition(char)
+        if decomposition and not decomposition.startswith("<"):
+            result.append((char, unicodedata.normalize("NFD", char)))
+    return tuple(result)
+
+
+def build_tables(mappings):
+    """Build the tables of a character set from its {byte: Mapping} dict.
+
+    Mappings without a line number, like those of a base character set
+    defined elsewhere, are assumed to be consistent with each other.
+    """
+    decode_maps = {kind: {} for kind in KIND_NAMES}
+    encode_char_map = {}
+    encode_modifier_map = {}
+    encoded_by = {}
+    names = {}
+    for byte, mapping in sorted(mappings.items()):
+        check_mapping(mapping)
+        decode_maps[mapping.kind][byte] = mapping.char
+        if mapping.decode_only:
+            continue
+        if mapping.kind == incremental.DECODE_MODIFIER:
+            encode_map = encode_modifier_map
+        else:
+            encode_map = encode_char_map
+        if mapping.char in encoded_by:
+            line = mapping.line
+            if line is None:
+                line = encoded_by[mapping.char].line
+            raise ValueError(
+                "line {}: U+{:04X} is already mapped, one of its mappings must "
+                "be decode-only".format(line, ord(mapping.char))
+            )
+        encode_map[mapping.char] = bytes([byte])
+        encoded_by[mapping.char] = mapping
+        names[mapping.char] = mapping.name
+
+    # ANSEL places modifiers before the character they modify, so the
+    # combining characters of a decomposition are encoded in reverse.
+    derived_chars = {}
+    derived_modifiers = {}
+    for char, decomposed in decompositions():
+        if char in encode_char_map or char in encode_modifier_map:
+            continue
+        if all(item in encode_modifier_map for item in decomposed):
+            derived_modifiers[char] = b"".join(
+                encode_modifier_map[item] for item in reversed(decomposed)
+            )
+        elif decomposed[0] in encode_char_map and all(
+            item in encode_modifier_map for item in decomposed[1:]
+        ):
+            modifiers = [encode_modifier_map[item] for item in reversed(decomposed[1:])]
+            derived_chars[char] = b"".join(modifiers) + encode_char_map[decomposed[0]]
+    encode_char_map.update(derived_chars)
+    encode_modifier_map.update(derived_modifiers)
+
+    tables = Tables(
+        decode_maps[incremental.DECODE_CONTROL],
+        decode_maps[incremental.DECODE_CHAR],
+        decode_maps[incremental.DECODE_MODIFIER],
+        dict(sorted(encode_char_map.items())),
+        dict(sorted(encode_modifier_map.items())),
+        incremental.build_decode_table(
+            decode_maps[incremental.DECODE_CHAR],
+            decode_maps[incremental.DECODE_CONTROL],
+            decode_maps[incremental.DECODE_MODIFIER],
+        ),
+        names,
+    )
+    check_round_trip(tables)
+    return tables
+
+
+def check_round_trip(tables):
+    """Check that every character decodes to what it was encoded from."""
+    error_handler = codecs.lookup_error("strict")
+    for encode_map, prefix in [
+        (tables.encode_char_map, ""),
+        (tables.encode_modifier_map, " "),
+    ]:
+        for char, encoded in encode_map.items():
+            decoded, _ = incremental.py_decode(
+                "generate",
+                tables.decode_table,
+                None,
+                encoded,
+                [],
+                incremental.MAX_MODIFIERS,
+                True,
+                error_handler,
+            )
+            if unicodedata.normalize("NFD", decoded) != unicodedata.normalize(
+                "NFD", prefix + char
+            ):
+                raise ValueError(
+                    "U+{:04X} is encoded as {!r}, which decodes to {!r}".format(
+                        ord(char), encoded, decoded
+                    )
+                )
+
+
+def str_literal(char):
+    if ord(char) > 0xFFFF:
+        return '"\\U{:08X}"'.format(ord(char))
+    return '"\\u{:04X}"'.format(ord(char))
+
+
+def bytes_literal(encoded):
+    return 'b"' + "".join("\\x{:02X}".format(byte) for byte in encoded) + '"'
+
+
+def char_name(tables, char):
+    return tables.names.get(char) or unicodedata.name(char, "")
+
+
+def format_dict(name, items):
+    lines = ["", "{} = {{".format(name)]
+    for key, value, comment in items:
+        lines.append("    {}: {},  # {}".format(key, value, comment))
+    lines.append("}")
+    return lines
+
+
+def format_tables(charset, tables):
+    prefix = charset.upper()
+    lines = []
+    for suffix, decode_map in [
+        ("_CONTROL", tables.decode_control_map),
+        ("", tables.decode_char_map),
+        ("_MODIFIERS", tables.decode_modifier_map),
+    ]:
+        lines += format_dict(
+            "{}_TO_UNICODE{}".format(prefix, suffix),
+            [
+                ("0x{:02X}".format(byte), str_literal(char), char_name(tables, char))
+                for byte, char in decode_map.items()
+            ],
+        )
+    for suffix, encode_map in [
+        ("", tables.encode_char_map),
+        ("_MODIFIERS", tables.encode_modifier_map),
+    ]:
+        lines += format_dict(
+            "UNICODE_TO_{}{}".format(prefix, suffix),
+            [
+                (str_literal(char), bytes_literal(encoded), char_name(tables, char))
+                for char, encoded in encode_map.items()
+            ],
+        )
+
+    lines += ["", "{}_DECODE_TABLE = (".format(prefix)]
+    for byte, (kind, char) in enumerate(tables.decode_table):
+        if char is None:
+            lines.append("    (DECODE_UNDEFINED, None),  # 0x{:02X}".format(byte))
+        else:
+            lines.append(
+                "    ({}, {}),  # 0x{:02X} {}".format(
+                    KIND_NAMES[kind], str_literal(char), byte, char_name(tables, char)
+                )
+            )
+    lines.append(")")
+    return lines
+
+
+def generate(source=SOURCE):
+    """Return the source of the _tables.py module generated from source."""
+    with open(source, encoding="utf-8") as fp:
+        charsets = parse(fp)
+    sections = [
+        "\n".join(format_tables(charset, build_tables(mappings))[1:])
+        for charset, mappings in charsets.items()
+    ]
+    return HEADER + "\n" + "\n\n\n".join(sections) + "\n"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with status 1 if _tables.py is out of date, without writing it",
+    )
+    args = parser.parse_args(argv)
+
+    generated = generate()
+    try:
+        with open(TARGET, encoding="utf-8") as fp:
+            current = fp.read()
+    except FileNotFoundError:
+        current = None
+    if args.check:
+        if generated != current:
+            print("{} is out of date".format(TARGET), file=sys.stderr)
+            return 1
+        return 0
+    if generated != current:
+        with open(TARGET, "w", encoding="utf-8") as fp:
+            fp.write(generated)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+from .. import codec
+from . import _tables
+
+MARC8_DECODE_TABLE = _tables.MARC8_DECODE_TABLE
+MARC8_TO_UNICODE = _tables.MARC8_TO_UNICODE
+MARC8_TO_UNICODE_CONTROL = _tables.MARC8_TO_UNICODE_CONTROL
+MARC8_TO_UNICODE_MODIFIERS = _tables.MARC8_TO_UNICODE_MODIFIERS
+UNICODE_TO_MARC8 = _tables.UNICODE_TO_MARC8
+UNICODE_TO_MARC8_MODIFIERS = _tables.UNICODE_TO_MARC8_MODIFIERS
+
+
+class Codec(codec.Codec):
+    name = "marc8"
+    encode_char_map = UNICODE_TO_MARC8
+    encode_modifier_map = UNICODE_TO_MARC8_MODIFIERS
+    decode_char_map = MARC8_TO_UNICODE
+    decode_control_map = MARC8_TO_UNICODE_CONTROL
+    decode_modifier_map = MARC8_TO_UNICODE_MODIFIERS
+    decode_table = MARC8_DECODE_TABLE
+
+
+IncrementalEncoder = Codec.incrementalencoder
+IncrementalDecoder = Codec.incrementaldecoder
+StreamReader = Codec.streamreader
+StreamWriter = Codec.streamwriter
+
+
+def getregentry():
+    return Codec.codec_info()
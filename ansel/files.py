@@ -0,0 +1,37 @@
+"""Decoding of ANSEL encoded files."""
+import mmap
+import os
+
+from .encodings import lookup
+
+CHUNK_SIZE = 1 << 20
+
+
+def decode_file(path, encoding="gedcom", errors="strict", chunk_size=CHUNK_SIZE):
+    """Decode the file at path, yielding the decoded text in chunks.
+
+    The file is memory-mapped and decoded chunk_size bytes at a time with an
+    incremental decoder, so only the current chunk of decoded text is held in
+    memory. Modifiers at the end of a chunk are held by the decoder until
+    their base character is read, so a chunk of text never separates a
+    character from its combining characters.
+    """
+    decoder = lookup(encoding).incrementaldecoder(errors)
+    with open(path, "rb") as fp:
+        # Empty files can't be memory-mapped.
+        if os.fstat(fp.fileno()).st_size == 0:
+            decoded = decoder.decode(b"", final=True)
+            if decoded:
+                yield decoded
+            return
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for start in range(0, len(mapped), chunk_size):
+                end = start + chunk_size
+                decoded = decoder.decode(mapped[start:end])
+                if decoded:
+                    yield decoded
+
+    decoded = decoder.decode(b"", final=True)
+    if decoded:
+        yield decoded
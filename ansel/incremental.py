@@ -1,4 +1,347 @@
 import codecs
+import functools
+import mmap
+import re
+import unicodedata
+
+DECODE_CHAR = 0
+DECODE_CONTROL = 1
+DECODE_MODIFIER = 2
+DECODE_UNDEFINED = 3
+
+DECODE_INTO_CHUNK_SIZE = 1 << 16
+
+# The most combining characters that may be pending on one character. This is
+# the limit of the Unicode Stream-Safe Text Format (UAX #15), more than any
+# real text needs, and keeps the work done for hostile input bounded.
+MAX_MODIFIERS = 30
+
+# The most distinct characters with combining characters whose composition
+# is remembered. The cache is bounded since the input decides what they are.
+COMPOSE_CACHE_SIZE = 1 << 12
+
+# The most distinct characters whose encoding by decomposition is remembered
+# by each encoder class, bounded for the same reason.
+DECOMPOSE_CACHE_SIZE = 1 << 12
+
+UNDEFINED_REASON = "character maps to <undefined>"
+TOO_MANY_MODIFIERS_REASON = "too many combining characters"
+
+
+def build_decode_table(decode_char_map, decode_control_map, decode_modifier_map):
+    """Build a 256 entry table of (byte class, decoded string) for each byte.
+
+    The maps are consulted in the same order the decoder used to probe them,
+    so a byte present in more than one map keeps the class of the first.
+    """
+    decode_table = []
+    for item in range(256):
+        if item in decode_char_map:
+            decode_table.append((DECODE_CHAR, decode_char_map[item]))
+        elif item in decode_control_map:
+            decode_table.append((DECODE_CONTROL, decode_control_map[item]))
+        elif item in decode_modifier_map:
+            decode_table.append((DECODE_MODIFIER, decode_modifier_map[item]))
+        else:
+            decode_table.append((DECODE_UNDEFINED, None))
+    return tuple(decode_table)
+
+
+def build_decode_passthrough_pattern(decode_table):
+    """Build a pattern matching runs of ASCII bytes that decode to themselves.
+
+    Returns None if the table doesn't contain such a byte.
+    """
+    passthrough = bytes(
+        item
+        for item, (kind, decoded_item) in enumerate(decode_table[:0x80])
+        if kind in (DECODE_CHAR, DECODE_CONTROL) and decoded_item == chr(item)
+    )
+    if not passthrough:
+        return None
+    return re.compile(b"[" + re.escape(passthrough) + b"]+")
+
+
+def build_modifier_bytes(decode_table):
+    """Build a dict of {modifier: byte} for each modifier in decode_table.
+
+    A modifier decoded from more than one byte maps to the first of them, which
+    decodes to the same modifier.
+    """
+    modifier_bytes = {}
+    for item, (kind, decoded_item) in enumerate(decode_table):
+        if kind == DECODE_MODIFIER:
+            modifier_bytes.setdefault(decoded_item, item)
+    return modifier_bytes
+
+
+def build_encode_passthrough_pattern(encode_char_map, encode_modifier_map):
+    """Build a pattern matching runs of ASCII characters that encode to themselves.
+
+    Returns None if the maps don't contain such a character.
+    """
+    passthrough = []
+    for item, encoded_item in encode_char_map.items():
+        if len(item) != 1 or item >= "\x80" or item in encode_modifier_map:
+            continue
+        if encoded_item == item.encode("ascii"):
+            passthrough.append(item)
+    if not passthrough:
+        return None
+    return re.compile("[" + re.escape("".join(sorted(passthrough))) + "]+")
+
+
+def build_decomposer(encode_char_map, encode_modifier_map):
+    """Build a function encoding a character by its canonical decomposition.
+
+    The function returns a list of the encoded base character followed by its
+    encoded combining characters, or None if the decomposition can't be
+    encoded. The base is the longest start of the decomposition that composes
+    to a character in encode_char_map, so a partly decomposed character like
+    U+1EF1 (u with horn and dot below) keeps the precomposed u with horn.
+    The results for up to DECOMPOSE_CACHE_SIZE characters are memoized, so a
+    character that's encoded often is only decomposed once.
+    """
+
+    @functools.lru_cache(maxsize=DECOMPOSE_CACHE_SIZE)
+    def decomposer(item):
+        decomposed = unicodedata.normalize("NFD", item)
+        for end in range(len(decomposed), 0, -1):
+            encoded_item = encode_char_map.get(
+                unicodedata.normalize("NFC", decomposed[:end])
+            )
+            if encoded_item is None:
+                continue
+            encoded_chars = [encoded_item]
+            for modifier in decomposed[end:]:
+                encoded_modifier = encode_modifier_map.get(modifier)
+                if encoded_modifier is None:
+                    return None
+                encoded_chars.append(encoded_modifier)
+            return encoded_chars
+        return None
+
+    return decomposer
+
+
+@functools.lru_cache(maxsize=COMPOSE_CACHE_SIZE)
+def compose_nfc(cluster):
+    """Return the NFC form of a decoded character and its combining characters."""
+    return unicodedata.normalize("NFC", cluster)
+
+
+COMPOSERS = {None: None, "NFC": compose_nfc}
+
+
+def get_composer(normalize):
+    """Return the composer for a decoder's normalize attribute."""
+    try:
+        return COMPOSERS[normalize]
+    except KeyError:
+        raise ValueError(
+            "unsupported normalization form {!r}".format(normalize)
+        ) from None
+
+
+def join_cluster(decoded_item, decoded_modifiers, composer):
+    """Return a decoded character followed by its pending modifiers."""
+    cluster = decoded_item + "".join(reversed(decoded_modifiers))
+    if composer is not None:
+        cluster = composer(cluster)
+    return cluster
+
+
+def as_bytes(input):
+    """Return input as a sequence of byte values, copying it only if necessary.
+
+    Any object supporting the buffer protocol is accepted. Contiguous buffers
+    are viewed in place, only non-contiguous buffers are copied.
+    """
+    if isinstance(input, (bytes, bytearray, mmap.mmap)):
+        return input
+    view = memoryview(input)
+    if not view.c_contiguous:
+        return view.tobytes()
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+
+def py_decode(
+    name,
+    decode_table,
+    passthrough_pattern,
+    input,
+    decoded_modifiers,
+    max_modifiers,
+    final,
+    error_handler,
+    composer=None,
+):
+    """Decode input, returning the decoded string and the pending modifiers.
+
+    Pending modifiers are kept in the order they were read and emitted in
+    reverse, since the modifier read last is the first combining character
+    after its base character. A modifier that would make more than
+    max_modifiers pending is an error. If composer is given, each character
+    emitted with modifiers is passed to it together with them, and replaced
+    by the string it returns.
+
+    This is the pure Python implementation of the decoder state machine, it is
+    replaced by the equivalent function from ``ansel._speedups`` when that
+    extension module is available.
+    """
+    decoded_chars = []
+    index = 0
+    end = len(input)
+    while index < end:
+        # Runs of bytes that decode to themselves are passed through in
+        # bulk, only bytes that need a lookup are decoded one at a time.
+        if passthrough_pattern is not None and not decoded_modifiers:
+            match = passthrough_pattern.match(input, index)
+            if match is not None:
+                run_end = match.end()
+                decoded_chars.append(str(input[index:run_end], "ascii"))
+                index = run_end
+                if index == end:
+                    break
+
+        kind, decoded_item = decode_table[input[index]]
+        if kind == DECODE_CHAR:
+            if decoded_modifiers:
+                decoded_chars.append(
+                    join_cluster(decoded_item, decoded_modifiers, composer)
+                )
+                decoded_modifiers = []
+            else:
+                decoded_chars.append(decoded_item)
+        elif kind == DECODE_MODIFIER and len(decoded_modifiers) < max_modifiers:
+            decoded_modifiers.append(decoded_item)
+        elif kind == DECODE_CONTROL:
+            if decoded_modifiers:
+                decoded_chars.append(join_cluster(" ", decoded_modifiers, composer))
+                decoded_modifiers = []
+            decoded_chars.append(decoded_item)
+        else:
+            if kind == DECODE_MODIFIER:
+                reason = TOO_MANY_MODIFIERS_REASON
+            else:
+                reason = UNDEFINED_REASON
+            decoded_item, _ = error_handler(
+                UnicodeDecodeError(name, input, index, index + 1, reason)
+            )
+            if decoded_modifiers:
+                decoded_chars.append(
+                    join_cluster(decoded_item, decoded_modifiers, composer)
+                )
+                decoded_modifiers = []
+            else:
+                decoded_chars.append(decoded_item)
+        index += 1
+
+    if final and decoded_modifiers:
+        decoded_chars.append(join_cluster(" ", decoded_modifiers, composer))
+        decoded_modifiers = []
+
+    return "".join(decoded_chars), decoded_modifiers
+
+
+def py_encode(
+    name,
+    encode_char_map,
+    encode_modifier_map,
+    passthrough_pattern,
+    input,
+    current_char,
+    max_modifiers,
+    final,
+    error_handler,
+    decomposer=None,
+):
+    """Encode input, returning the encoded bytes and the pending character.
+
+    The pending character is a list of the base character followed by its
+    combining characters in the order they were read, and is emitted in
+    reverse since ANSEL modifiers precede the character they modify. A
+    combining character that would make more than max_modifiers pending is an
+    error. A character in neither map is passed to decomposer, if given, which
+    returns the pending character to encode it as, or None if it is an error.
+
+    This is the pure Python implementation of the encoder state machine, it is
+    replaced by the equivalent function from ``ansel._speedups`` when that
+    extension module is available.
+    """
+    encoded_chars = []
+    index = 0
+    end = len(input)
+    while index < end:
+        # Runs of characters that encode to themselves are encoded in
+        # bulk. The last character of a run is kept as the current
+        # character, since combining characters that follow modify it.
+        if passthrough_pattern is not None:
+            match = passthrough_pattern.match(input, index)
+            if match is not None:
+                last = match.end() - 1
+                encoded_chars += reversed(current_char)
+                encoded_chars.append(input[index:last].encode("ascii"))
+                current_char = [input[last].encode("ascii")]
+                index = last + 1
+                if index == end:
+                    break
+
+        item = input[index]
+        try:
+            encoded_item = encode_char_map[item]
+            encoded_chars += reversed(current_char)
+            current_char = [encoded_item]
+        except KeyError:
+            encoded_item = encode_modifier_map.get(item)
+            decomposed = None
+            if encoded_item is None and decomposer is not None:
+                decomposed = decomposer(item)
+            if encoded_item is not None and len(current_char) <= max_modifiers:
+                current_char.append(encoded_item)
+            elif decomposed is not None and len(decomposed) <= max_modifiers + 1:
+                encoded_chars += reversed(current_char)
+                current_char = list(decomposed)
+            else:
+                if encoded_item is not None:
+                    reason = TOO_MANY_MODIFIERS_REASON
+                else:
+                    reason = UNDEFINED_REASON
+                try:
+                    item, _ = error_handler(
+                        UnicodeEncodeError(name, input, index, index + 1, reason)
+                    )
+                    encoded_item, current_char = py_encode(
+                        name,
+                        encode_char_map,
+                        encode_modifier_map,
+                        passthrough_pattern,
+                        item,
+                        current_char,
+                        max_modifiers,
+                        False,
+                        error_handler,
+                        decomposer,
+                    )
+                    encoded_chars.append(encoded_item)
+                except UnicodeEncodeError:
+                    current_char = []
+                    raise
+        index += 1
+
+    if final:
+        encoded_chars += reversed(current_char)
+        current_char = []
+
+    return b"".join(encoded_chars), current_char
+
+
+try:
+    from ._speedups import decode, encode
+except ImportError:
+    decode, encode = py_decode, py_encode
 
 
 class IncrementalDecoder(codecs.IncrementalDecoder):
@@ -6,147 +349,170 @@ class IncrementalDecoder(codecs.IncrementalDecoder):
     decode_char_map = {}
     decode_control_map = {}
     decode_modifier_map = {}
+    decode_table = build_decode_table({}, {}, {})
+    passthrough_pattern = None
+    modifier_bytes = {}
+    max_modifiers = MAX_MODIFIERS
+    # The normalization form of the decoded text, None or "NFC".
+    normalize = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass may define a prebuilt table, like those generated for the
+        # encodings in ansel.encodings.
+        if "decode_table" not in cls.__dict__:
+            cls.decode_table = build_decode_table(
+                cls.decode_char_map, cls.decode_control_map, cls.decode_modifier_map
+            )
+        cls.passthrough_pattern = build_decode_passthrough_pattern(cls.decode_table)
+        cls.modifier_bytes = build_modifier_bytes(cls.decode_table)
 
     def __init__(self, errors="strict"):
         super().__init__(errors)
         self.decoded_modifiers = []
+        self._state = None
+
+    def reset(self):
+        self.decoded_modifiers = []
+        self._state = None
 
     def getstate(self):
+        """Return the decoder state as (bytes, 0).
+
+        The bytes are the modifiers pending until their base character is
+        decoded, one byte each, so they are at most max_modifiers long. The
+        flags are always 0, which keeps :py:meth:`io.TextIOWrapper.tell` cookies
+        small. The state is cached until the next call to decode.
+        """
         if not self.decoded_modifiers:
             return (b"", 0)
-        state = 1
-        for item in self.decoded_modifiers:
-            for char in item:
-                state <<= 24
-                state += ord(char)
-        return (b"", state)
+        if self._state is None:
+            modifier_bytes = self.modifier_bytes
+            pending = bytes(modifier_bytes[item] for item in self.decoded_modifiers)
+            self._state = (pending, 0)
+        return self._state
 
     def setstate(self, state):
-        decoded_modifiers = []
-        _, state = state
-        while state > 1:
-            char = state & 0xFFFFFF
-            state >>= 24
-            decoded_modifiers.append(chr(char))
-        decoded_modifiers.reverse()
-        self.decoded_modifiers = decoded_modifiers
+        """Restore the state returned by getstate, decoding its pending bytes."""
+        pending, _ = state
+        self.reset()
+        if pending:
+            self.decode(pending)
 
     def decode(self, input, final=False):
-        decode_char_map = self.decode_char_map
-        decode_control_map = self.decode_control_map
-        decode_modifier_map = self.decode_modifier_map
-        decoded_modifiers = self.decoded_modifiers
-        error_handler = codecs.lookup_error(self.errors)
-
-        decoded_chars = []
-        for index, item in enumerate(iter(input)):
+        """Decode input, which may be any object supporting the buffer protocol.
+
+        Buffers such as memoryview slices, bytearray or mmap are decoded in
+        place without being copied to bytes first.
+        """
+        self._state = None
+        decoded_chars, self.decoded_modifiers = decode(
+            self.name,
+            self.decode_table,
+            self.passthrough_pattern,
+            as_bytes(input),
+            self.decoded_modifiers,
+            self.max_modifiers,
+            final,
+            codecs.lookup_error(self.errors),
+            get_composer(self.normalize),
+        )
+        return decoded_chars
+
+    def decode_into(self, input, out, final=False, chunk_size=DECODE_INTO_CHUNK_SIZE):
+        """Decode input, writing the decoded text to out.
+
+        out may be any object with a write method, for example an io.StringIO
+        reused across calls. input is decoded chunk_size bytes at a time, so
+        the temporary memory used while decoding is bounded however large
+        input is. Returns the number of characters written.
+        """
+        input = as_bytes(input)
+        size = len(input)
+        written = 0
+        start = 0
+        while True:
+            end = start + chunk_size
             try:
-                decoded_item = decode_char_map[item]
-                decoded_chars.append(decoded_item)
-                if decoded_modifiers:
-                    decoded_chars += decoded_modifiers
-                    decoded_modifiers = []
-            except KeyError:
-                try:
-                    decoded_item = decode_control_map[item]
-                    if decoded_modifiers:
-                        decoded_chars.append(" ")
-                        decoded_chars += decoded_modifiers
-                        decoded_modifiers = []
-                    decoded_chars.append(decoded_item)
-                except KeyError:
-                    try:
-                        decoded_item = decode_modifier_map[item]
-                        decoded_modifiers.insert(0, decoded_item)
-                    except KeyError:
-                        decoded_item, _ = error_handler(
-                            UnicodeDecodeError(
-                                self.name,
-                                input,
-                                index,
-                                index + 1,
-                                "character maps to <undefined>",
-                            )
-                        )
-                        decoded_chars.append(decoded_item)
-                        if decoded_modifiers:
-                            decoded_chars += decoded_modifiers
-                            decoded_modifiers = []
-
-        if final and decoded_modifiers:
-            decoded_chars.append(" ")
-            decoded_chars += decoded_modifiers
-            decoded_modifiers = []
-
-        self.decoded_modifiers = decoded_modifiers
-        return "".join(decoded_chars)
+                decoded_chars = self.decode(input[start:end], final and end >= size)
+            except UnicodeDecodeError as e:
+                raise UnicodeDecodeError(
+                    e.encoding, input, start + e.start, start + e.end, e.reason
+                ) from None
+            if decoded_chars:
+                out.write(decoded_chars)
+                written += len(decoded_chars)
+            if end >= size:
+                return written
+            start = end
 
 
 class IncrementalEncoder(codecs.IncrementalEncoder):
     name = None
     encode_char_map = {}
     encode_modifier_map = {}
+    passthrough_pattern = None
+    max_modifiers = MAX_MODIFIERS
+    # Whether characters in neither map are encoded by their decomposition.
+    decompose = False
+    decomposer = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.passthrough_pattern = build_encode_passthrough_pattern(
+            cls.encode_char_map, cls.encode_modifier_map
+        )
+        cls.decomposer = staticmethod(
+            build_decomposer(cls.encode_char_map, cls.encode_modifier_map)
+        )
 
     def __init__(self, errors="strict"):
         super().__init__(errors)
         self.current_char = []
+        self._state = None
+
+    def reset(self):
+        self.current_char = []
+        self._state = None
 
     def getstate(self):
+        """Return the encoder state as an int.
+
+        The int is 0 when no character is pending. Otherwise it is a 1 bit
+        followed by the bytes of the pending character, in the order they
+        will be emitted. At most max_modifiers combining characters are
+        pending, so the state is bounded. It is cached until the next call to
+        encode.
+        """
         if not self.current_char:
             return 0
-        state = 1
-        for item in self.current_char:
-            for byte in iter(item):
-                state <<= 8
-                state += byte
-        return state
+        if self._state is None:
+            emitted = b"".join(reversed(self.current_char))
+            self._state = int.from_bytes(b"\x01" + emitted, "big")
+        return self._state
 
     def setstate(self, state):
         current_char = []
-        while state > 1:
-            byte = state & 0xFF
-            state >>= 8
-            current_char.append(bytes((byte,)))
-        current_char.reverse()
+        if state > 1:
+            emitted = state.to_bytes((state.bit_length() + 7) // 8, "big")[1:]
+            # The pending bytes are emitted as one item, modifiers encoded
+            # later are still emitted before them.
+            current_char = [emitted]
         self.current_char = current_char
+        self._state = state
 
     def encode(self, input, final=False):
-        encode_char_map = self.encode_char_map
-        encode_modifier_map = self.encode_modifier_map
-        current_char = self.current_char
-        error_handler = codecs.lookup_error(self.errors)
-
-        encoded_chars = []
-        for index, item in enumerate(input):
-            try:
-                encoded_item = encode_char_map[item]
-                encoded_chars += current_char
-                current_char = [encoded_item]
-            except KeyError:
-                try:
-                    current_char.insert(0, encode_modifier_map[item])
-                except KeyError:
-                    try:
-                        item, _ = error_handler(
-                            UnicodeEncodeError(
-                                self.name,
-                                input,
-                                index,
-                                index + 1,
-                                "character maps to <undefined>",
-                            )
-                        )
-                        self.current_char = current_char
-                        encoded_item = self.encode(item)
-                        current_char = self.current_char
-                        encoded_chars.append(encoded_item)
-                    except UnicodeEncodeError:
-                        current_char = []
-                        raise
-
-        if final:
-            encoded_chars += current_char
-            current_char = []
-
-        self.current_char = current_char
-        return b"".join(encoded_chars)
+        self._state = None
+        encoded_chars, self.current_char = encode(
+            self.name,
+            self.encode_char_map,
+            self.encode_modifier_map,
+            self.passthrough_pattern,
+            input,
+            self.current_char,
+            self.max_modifiers,
+            final,
+            codecs.lookup_error(self.errors),
+            self.decomposer if self.decompose else None,
+        )
+        return encoded_chars
@@ -0,0 +1,135 @@
+"""Random access into ANSEL encoded files."""
+import bisect
+
+from .encodings import lookup
+
+EVERY = 1 << 16
+READ_SIZE = 1 << 16
+
+
+class Index:
+    """Checkpoints for decoding a file from positions other than its start.
+
+    Each checkpoint is a tuple of a byte offset in the file, the offset of the
+    first character decoded from the bytes at it, and the state of the decoder
+    at that byte offset, as returned by its getstate method.
+    """
+
+    def __init__(self, path, encoding, errors, checkpoints, length):
+        self.path = path
+        self.encoding = encoding
+        self.errors = errors
+        self.checkpoints = checkpoints
+        self.length = length
+        self.char_offsets = [checkpoint[1] for checkpoint in checkpoints]
+
+    def find(self, offset):
+        """Return the last checkpoint at or before the character offset."""
+        index = bisect.bisect_right(self.char_offsets, offset) - 1
+        return self.checkpoints[max(index, 0)]
+
+    def open(self):
+        """Return an :py:class:`IndexedReader` for the indexed file."""
+        return IndexedReader(self)
+
+
+class IndexedReader:
+    """Read decoded text from any character offset of an indexed file.
+
+    Seeking restores the decoder state saved at the nearest checkpoint and
+    decodes from there, so at most the bytes between two checkpoints are
+    decoded to reach any offset.
+    """
+
+    def __init__(self, index):
+        self.index = index
+        self.decoder = lookup(index.encoding).incrementaldecoder(index.errors)
+        self.fp = open(index.path, "rb")
+        self.position = 0
+        self.buffer = ""
+        self.buffer_position = 0
+        self.eof = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.fp.close()
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset):
+        """Move to the character offset, returning the new position.
+
+        Offsets past the end of the file move to the end of the file.
+        """
+        if offset < 0:
+            raise ValueError("negative seek position {!r}".format(offset))
+        byte_offset, char_offset, state = self.index.find(offset)
+        # Reading forward from the current position is cheaper than going
+        # back to a checkpoint behind it.
+        if not char_offset <= self.position <= offset:
+            self.fp.seek(byte_offset)
+            self.decoder.setstate(state)
+            self.position = char_offset
+            self.buffer = ""
+            self.buffer_position = 0
+            self.eof = False
+        self.read(offset - self.position)
+        return self.position
+
+    def read(self, size=-1):
+        """Read and return at most size characters, or all if size is negative."""
+        if size is None:
+            size = -1
+        chunks = []
+        while True:
+            start = self.buffer_position
+            available = len(self.buffer) - start
+            if 0 <= size <= available:
+                end = start + size
+                chunks.append(self.buffer[start:end])
+                self.buffer_position = end
+                break
+            chunks.append(self.buffer[start:])
+            if size > 0:
+                size -= available
+            if self.eof:
+                self.buffer_position = len(self.buffer)
+                break
+            data = self.fp.read(READ_SIZE)
+            self.eof = not data
+            self.buffer = self.decoder.decode(data, final=self.eof)
+            self.buffer_position = 0
+
+        text = "".join(chunks)
+        self.position += len(text)
+        return text
+
+
+def build(path, encoding="gedcom", errors="strict", every=EVERY):
+    """Index the file at path with a checkpoint every so many bytes.
+
+    Returns an :py:class:`Index`, whose open method returns a reader that can
+    seek to any character offset without decoding the file from its start.
+    Any encoding registered with :py:mod:`codecs` whose incremental decoder
+    supports getstate and setstate may be used.
+    """
+    decoder = lookup(encoding).incrementaldecoder(errors)
+    byte_offset = 0
+    char_offset = 0
+    checkpoints = [(byte_offset, char_offset, decoder.getstate())]
+    with open(path, "rb") as fp:
+        while True:
+            data = fp.read(every)
+            if not data:
+                break
+            byte_offset += len(data)
+            char_offset += len(decoder.decode(data))
+            checkpoints.append((byte_offset, char_offset, decoder.getstate()))
+    char_offset += len(decoder.decode(b"", final=True))
+    return Index(path, encoding, errors, checkpoints, char_offset)
@@ -0,0 +1,249 @@
+"""Parallel decoding and encoding of large ANSEL buffers."""
+import os
+
+from . import incremental
+from .encodings import define_dialects, get_dialect_definitions, lookup
+
+# concurrent.futures and multiprocessing are imported by the functions that
+# use them, since importing them takes longer than importing everything else.
+
+MIN_CHUNK_SIZE = 1 << 20
+
+
+def get_shared_memory():
+    """Return the multiprocessing.shared_memory module, or None if unavailable."""
+    try:
+        from multiprocessing import shared_memory
+    except ImportError:  # Python < 3.8
+        return None
+    return shared_memory
+
+
+def find_split_points(data, decode_table, chunk_size):
+    """Return the offsets to split data at into chunks of about chunk_size.
+
+    An offset is only safe to split at if the byte before it isn't a modifier,
+    since a modifier is always decoded together with the character after it.
+    """
+    modifier = incremental.DECODE_MODIFIER
+    split_points = [0]
+    end = len(data)
+    start = chunk_size
+    while start < end:
+        while start < end and decode_table[data[start - 1]][0] == modifier:
+            start += 1
+        if start < end:
+            split_points.append(start)
+        start += chunk_size
+    split_points.append(end)
+    return split_points
+
+
+def find_text_split_points(text, encode_modifier_map, chunk_size):
+    """Return the offsets to split text at into chunks of about chunk_size.
+
+    An offset is only safe to split at if the character at it isn't a
+    combining character, since a combining character is always encoded
+    together with the character before it.
+    """
+    split_points = [0]
+    end = len(text)
+    start = chunk_size
+    while start < end:
+        while start < end and text[start] in encode_modifier_map:
+            start += 1
+        if start < end:
+            split_points.append(start)
+        start += chunk_size
+    split_points.append(end)
+    return split_points
+
+
+def _decode_chunk(encoding, errors, dialects, chunk):
+    # Dialects defined at runtime, in the process calling parallel_decode, are
+    # defined again in processes that didn't inherit them.
+    define_dialects(dialects)
+    return lookup(encoding).decode(chunk, errors)[0]
+
+
+def _decode_shared_chunk(encoding, errors, dialects, name, start, end):
+    from multiprocessing import shared_memory
+
+    buffer = shared_memory.SharedMemory(name)
+    try:
+        # The chunk is decoded in place, and its view released before the
+        # shared memory is closed.
+        with buffer.buf[start:end] as chunk:
+            try:
+                return _decode_chunk(encoding, errors, dialects, chunk)
+            except UnicodeDecodeError as e:
+                # The arguments and traceback of the error reference the view,
+                # which would keep the shared memory from being closed and
+                # can't be pickled. Its object attribute is a copy.
+                error = UnicodeDecodeError(
+                    e.encoding, e.object, e.start, e.end, e.reason
+                )
+    finally:
+        buffer.close()
+    raise error
+
+
+def _encode_chunk(encoding, errors, dialects, chunk):
+    define_dialects(dialects)
+    return lookup(encoding).encode(chunk, errors)[0]
+
+
+def parallel_decode(
+    data,
+    encoding="gedcom",
+    errors="strict",
+    workers=None,
+    chunk_size=None,
+    executor=None,
+):
+    """Decode data using multiple processes.
+
+    data is split into chunks at offsets where no modifier is separated from
+    its base character, the chunks are decoded in a process pool, and the
+    decoded text is joined. The result is identical to decoding data in one
+    call, including the offsets reported by a :py:exc:`UnicodeDecodeError`.
+
+    Where available, data is shared with the worker processes through shared
+    memory rather than pickled. Dialects defined with
+    :py:func:`ansel.define_dialect` are defined again in worker processes that
+    don't have them, but custom error handlers must also be registered in the
+    worker processes. An existing executor may be passed to avoid the
+    cost of starting a pool for each call.
+
+    Encodings other than those provided by this package are decoded serially.
+    """
+    codec_info = lookup(encoding)
+    decoder_class = codec_info.incrementaldecoder
+    if not issubclass(decoder_class, incremental.IncrementalDecoder):
+        return codec_info.decode(data, errors)[0]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(data) // (workers * 4)))
+    split_points = find_split_points(data, decoder_class.decode_table, chunk_size)
+    if workers == 1 or len(split_points) <= 2:
+        return codec_info.decode(data, errors)[0]
+
+    import concurrent.futures
+
+    dialects = get_dialect_definitions(encoding)
+    shared_memory = get_shared_memory()
+    buffer = None
+    owns_executor = executor is None
+    if owns_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(workers)
+    try:
+        if shared_memory is not None:
+            size = len(data)
+            buffer = shared_memory.SharedMemory(create=True, size=size)
+            buffer.buf[:size] = data
+            futures = [
+                executor.submit(
+                    _decode_shared_chunk,
+                    encoding,
+                    errors,
+                    dialects,
+                    buffer.name,
+                    start,
+                    end,
+                )
+                for start, end in zip(split_points, split_points[1:])
+            ]
+        else:
+            futures = [
+                executor.submit(
+                    _decode_chunk, encoding, errors, dialects, data[start:end]
+                )
+                for start, end in zip(split_points, split_points[1:])
+            ]
+
+        decoded_chunks = []
+        for start, future in zip(split_points, futures):
+            try:
+                decoded_chunks.append(future.result())
+            except UnicodeDecodeError as e:
+                raise UnicodeDecodeError(
+                    e.encoding, data, start + e.start, start + e.end, e.reason
+                ) from None
+        return "".join(decoded_chunks)
+    finally:
+        if owns_executor:
+            executor.shutdown()
+        if buffer is not None:
+            buffer.close()
+            buffer.unlink()
+
+
+def parallel_encode(
+    input,
+    encoding="gedcom",
+    errors="strict",
+    workers=None,
+    chunk_size=None,
+    executor=None,
+):
+    """Encode input using multiple processes.
+
+    input is either a str or an iterable of str records, which are encoded as
+    if they were joined. The text is split into chunks at offsets where no
+    combining character is separated from its base character, the chunks are
+    encoded in a process pool, and the encoded bytes are joined. The result is
+    identical to encoding the text in one call, including the offsets
+    reported by a :py:exc:`UnicodeEncodeError`.
+
+    Dialects defined with :py:func:`ansel.define_dialect` are defined again in
+    worker processes that don't have them, but custom error handlers must also
+    be registered in the worker processes. An
+    existing executor may be passed to avoid the cost of starting a pool for
+    each call.
+
+    Encodings other than those provided by this package are encoded serially.
+    """
+    if not isinstance(input, str):
+        input = "".join(input)
+
+    codec_info = lookup(encoding)
+    encoder_class = codec_info.incrementalencoder
+    if not issubclass(encoder_class, incremental.IncrementalEncoder):
+        return codec_info.encode(input, errors)[0]
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = max(MIN_CHUNK_SIZE, -(-len(input) // (workers * 4)))
+    split_points = find_text_split_points(
+        input, encoder_class.encode_modifier_map, chunk_size
+    )
+    if workers == 1 or len(split_points) <= 2:
+        return codec_info.encode(input, errors)[0]
+
+    import concurrent.futures
+
+    dialects = get_dialect_definitions(encoding)
+    owns_executor = executor is None
+    if owns_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(workers)
+    try:
+        futures = [
+            executor.submit(_encode_chunk, encoding, errors, dialects, input[start:end])
+            for start, end in zip(split_points, split_points[1:])
+        ]
+
+        encoded_chunks = []
+        for start, future in zip(split_points, futures):
+            try:
+                encoded_chunks.append(future.result())
+            except UnicodeEncodeError as e:
+                raise UnicodeEncodeError(
+                    e.encoding, input, start + e.start, start + e.end, e.reason
+                ) from None
+        return b"".join(encoded_chunks)
+    finally:
+        if owns_executor:
+            executor.shutdown()
@@ -0,0 +1,65 @@
+"""Streaming of GEDCOM records."""
+import collections
+import re
+
+from .encodings import lookup
+
+CHUNK_SIZE = 1 << 16
+
+# A level 0 line, which starts a record. Leading whitespace is allowed, since
+# some writers indent lines by their level.
+RECORD_START = re.compile(rb"(?<![^\r\n])[ \t]*0[ \t]")
+
+# The end of a GEDCOM line, which is only ever CR, LF or CR LF, as for
+# ansel.codec.StreamReader. The other control characters str.splitlines splits
+# on are part of the line.
+LINE_BREAK = re.compile(r"\r\n?|\n")
+
+
+class Record(collections.namedtuple("Record", ["data", "text"])):
+    """A level 0 GEDCOM record, as its encoded bytes and its decoded text."""
+
+    __slots__ = ()
+
+    @property
+    def lines(self):
+        lines = LINE_BREAK.split(self.text)
+        if not lines[-1]:
+            lines.pop()
+        return lines
+
+
+def gedcom_records(fileobj, encoding="gedcom", errors="strict", chunk_size=CHUNK_SIZE):
+    """Read GEDCOM records from the binary file object, yielding a Record each.
+
+    The file is read chunk_size bytes at a time and split into records at the
+    start of each level 0 line before decoding, so only the records in the
+    current chunk are held in memory. Any bytes before the first level 0 line
+    are part of the first record. Modifiers can't be separated from their base
+    character by a line break, so the records are decoded independently of
+    each other. The encoding must be ASCII compatible, like ANSEL and UTF-8.
+    """
+    decoder = lookup(encoding).incrementaldecoder(errors)
+    buffer = b""
+    search_from = 1
+    while True:
+        data = fileobj.read(chunk_size)
+        buffer += data
+        start = 0
+        for match in RECORD_START.finditer(buffer, search_from):
+            end = match.start()
+            record = buffer[start:end]
+            yield Record(record, decoder.decode(record))
+            start = end
+        if not data:
+            break
+        buffer = buffer[start:]
+        # A record can only start after a line break, so only the last,
+        # possibly incomplete line needs to be searched again.
+        line_start = max(buffer.rfind(b"\n"), buffer.rfind(b"\r")) + 1
+        search_from = max(line_start, 1)
+
+    record = buffer[start:]
+    text = decoder.decode(record, final=True)
+    if record:
+        yield Record(record, text)
@@ -0,0 +1,309 @@
+"""Throughput benchmarks for the ANSEL codecs.
+
+Run from the repository root::
+
+    $ poetry run python benchmarks/bench.py
+
+Each benchmark reports the throughput in MB/s of encoded data. Use
+``--pure-python`` to measure the pure Python implementation when the
+``ansel._speedups`` extension is built, and ``--json`` to save the results for
+comparison between versions.
+"""
+import argparse
+import codecs
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import ansel  # noqa: E402
+import ansel.incremental  # noqa: E402
+
+CHUNK_SIZES = [64, 4096, 65536]
+FIELD_SIZES = [16, 128]
+
+GIVEN_NAMES = ["Anna", "Björn", "Zoë", "François", "Łukasz", "José", "Ångström"]
+SURNAMES = ["Dvořák", "Müller", "Nuñez", "Smith", "Ödegaard", "Čapek", "Jones"]
+PLACES = ["Plzeň, Bohemia", "Kraków, Poland", "São Paulo, Brazil", "Boston, USA"]
+
+# Bytes the gedcom encoding doesn't define.
+UNDEFINED_BYTES = [b"\x80", b"\xFD", b"\xFF"]
+
+
+def ascii_corpus(size):
+    rng = random.Random(0)
+    words = ["the", "of", "and", "NAME", "BIRT", "DATE", "PLAC", "1850", "@I1@"]
+    text = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return " ".join(text)
+
+
+def latin_corpus(size):
+    rng = random.Random(0)
+    words = GIVEN_NAMES + SURNAMES + ["Köln", "Hélène", "Grüße", "Øresund"]
+    text = []
+    length = 0
+    while length < size:
+        word = rng.choice(words)
+        text.append(word)
+        length += len(word) + 1
+    return " ".join(text)
+
+
+def gedcom_corpus(size):
+    rng = random.Random(0)
+    records = ["0 HEAD\n1 CHAR ANSEL\n"]
+    length = 0
+    index = 0
+    while length < size:
+        index += 1
+        record = (
+            "0 @I{index}@ INDI\n"
+            "1 NAME {given} /{surname}/\n"
+            "1 BIRT\n"
+            "2 DATE {day} MAR {year}\n"
+            "2 PLAC {place}\n"
+            "1 NOTE Age ≠ {age}, ■ verified\n"
+        ).format(
+            index=index,
+            given=rng.choice(GIVEN_NAMES),
+            surname=rng.choice(SURNAMES),
+            day=rng.randint(1, 28),
+            year=rng.randint(1700, 1950),
+            place=rng.choice(PLACES),
+            age=rng.randint(1, 99),
+        )
+        records.append(record)
+        length += len(record)
+    records.append("0 TRLR\n")
+    return "".join(records)
+
+
+def error_corpus(size):
+    rng = random.Random(0)
+    chars = ["a", "b", "€", "一", " ", "é", "☃"]
+    return "".join(rng.choice(chars) for _ in range(size))
+
+
+CORPORA = {
+    "ascii": ascii_corpus,
+    "latin": latin_corpus,
+    "gedcom": gedcom_corpus,
+    "errors": error_corpus,
+}
+
+
+def split(sequence, size):
+    chunks = []
+    for start in range(0, len(sequence), size):
+        end = start + size
+        chunks.append(sequence[start:end])
+    return chunks
+
+
+def error_data(text):
+    """Encode text with an undefined byte for each character without a mapping."""
+    # error_corpus has no question marks besides the replaced characters.
+    parts = codecs.encode(text, "gedcom", "replace").split(b"?")
+    undefined = itertools.cycle(UNDEFINED_BYTES)
+    data = [parts[0]]
+    for part in parts[1:]:
+        data += [next(undefined), part]
+    return b"".join(data)
+
+
+def load_corpora(size):
+    corpora = {}
+    for name, factory in CORPORA.items():
+        text = factory(size)
+        if name == "errors":
+            # The encoding benchmarks see the unencodable text, and the
+            # decoding benchmarks undefined bytes, so both call the error
+            # handler.
+            corpora[name] = (text, error_data(text), "replace")
+        else:
+            data = codecs.encode(text, "gedcom")
+            # Decode the encoded data so encoding benchmarks see exactly the
+            # text the decoder produces.
+            corpora[name] = (codecs.decode(data, "gedcom"), data, "strict")
+    return corpora
+
+
+def bench_codec(text, data, errors, chunk_size):
+    codec_info = codecs.lookup("gedcom")
+    return {
+        "Codec.encode": lambda: codec_info.encode(text, errors),
+        "Codec.decode": lambda: codec_info.decode(data, errors),
+    }
+
+
+def bench_incremental(text, data, errors, chunk_size):
+    codec_info = codecs.lookup("gedcom")
+    text_chunks = split(text, chunk_size)
+    data_chunks = split(data, chunk_size)
+
+    def encode():
+        encoder = codec_info.incrementalencoder(errors)
+        for chunk in text_chunks:
+            encoder.encode(chunk)
+        encoder.encode("", final=True)
+
+    def decode():
+        decoder = codec_info.incrementaldecoder(errors)
+        for chunk in data_chunks:
+            decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+
+    return {"IncrementalEncoder": encode, "IncrementalDecoder": decode}
+
+
+def bench_stream(text, data, errors, chunk_size):
+    codec_info = codecs.lookup("gedcom")
+    text_chunks = split(text, chunk_size)
+
+    def write():
+        writer = codec_info.streamwriter(io.BytesIO(), errors)
+        for chunk in text_chunks:
+            writer.write(chunk)
+        writer.reset()
+
+    def read():
+        reader = codec_info.streamreader(io.BytesIO(data), errors)
+        while reader.read(chunk_size):
+            pass
+
+    def readline():
+        reader = codec_info.streamreader(io.BytesIO(data), errors)
+        for _ in reader:
+            pass
+
+    return {
+        "StreamWriter": write,
+        "StreamReader.read": read,
+        "StreamReader lines": readline,
+    }
+
+
+def bench_batch(text, data, errors, chunk_size):
+    text_fields = split(text, chunk_size)
+    data_fields = split(data, chunk_size)
+
+    def encode_each():
+        for field in text_fields:
+            codecs.encode(field, "gedcom", errors)
+
+    def decode_each():
+        for field in data_fields:
+            codecs.decode(field, "gedcom", errors)
+
+    return {
+        "codecs.encode each": encode_each,
+        "codecs.decode each": decode_each,
+        "encode_many": lambda: ansel.encode_many(text_fields, "gedcom", errors),
+        "decode_many": lambda: ansel.decode_many(data_fields, "gedcom", errors),
+    }
+
+
+BENCHMARKS = [
+    (bench_codec, [None]),
+    (bench_incremental, CHUNK_SIZES),
+    (bench_stream, CHUNK_SIZES),
+    (bench_batch, FIELD_SIZES),
+]
+
+
+def measure(function, repeat):
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(size, repeat, selected):
+    corpora = load_corpora(size)
+    results = []
+    for factory, chunk_sizes in BENCHMARKS:
+        for chunk_size in chunk_sizes:
+            for corpus, (text, data, errors) in corpora.items():
+                for name, function in factory(text, data, errors, chunk_size).items():
+                    if selected and not any(item in name for item in selected):
+                        continue
+                    seconds = measure(function, repeat)
+                    result = {
+                        "benchmark": name,
+                        "corpus": corpus,
+                        "chunk_size": chunk_size,
+                        "mb_per_s": len(data) / seconds / 1e6,
+                    }
+                    results.append(result)
+                    print(
+                        "{benchmark:<20} {corpus:<8} {chunk:>8} {mb_per_s:>10.2f} MB/s".format(
+                            chunk=chunk_size or "-", **result
+                        ),
+                        flush=True,
+                    )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--size", type=int, default=1 << 20, help="approximate size of each corpus"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of timing repetitions"
+    )
+    parser.add_argument(
+        "--pure-python",
+        action="store_true",
+        help="measure the pure Python implementation",
+    )
+    parser.add_argument("--json", metavar="PATH", help="write the results to PATH")
+    parser.add_argument(
+        "benchmarks", nargs="*", help="only run benchmarks whose name contains these"
+    )
+    args = parser.parse_args(argv)
+
+    if args.pure_python:
+        ansel.incremental.decode = ansel.incremental.py_decode
+        ansel.incremental.encode = ansel.incremental.py_encode
+    ansel.register()
+
+    implementation = (
+        "python" if ansel.incremental.decode is ansel.incremental.py_decode else "c"
+    )
+    print(
+        "ansel {} ({} implementation) on {} {}".format(
+            ansel.__version__,
+            implementation,
+            platform.python_implementation(),
+            platform.python_version(),
+        )
+    )
+    results = run(args.size, args.repeat, args.benchmarks)
+
+    if args.json:
+        with open(args.json, "w") as fp:
+            json.dump(
+                {
+                    "version": ansel.__version__,
+                    "implementation": implementation,
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                fp,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Build the optional ``ansel._speedups`` extension module.
+
+The extension is only an accelerator, ``ansel.incremental`` falls back to its
+pure Python implementation when it isn't available. Failing to compile it, or
+building on an implementation other than CPython, is therefore not an error.
+
+The character set tables in ``ansel/encodings/_tables.py`` are regenerated
+from ``ansel/encodings/tables.txt`` first, so a build never has stale tables.
+"""
+import platform
+import sys
+import tempfile
+
+from setuptools import Distribution, Extension
+from setuptools.command.build_ext import build_ext
+
+ext_modules = [Extension("ansel._speedups", sources=["ansel/_speedups.c"])]
+
+
+class OptionalBuildExt(build_ext):
+    def run(self):
+        try:
+            super().run()
+        except Exception as e:
+            self.warn_build_failed(e)
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            self.warn_build_failed(e)
+
+    @staticmethod
+    def warn_build_failed(e):
+        print(
+            "WARNING: the ansel._speedups extension could not be compiled, "
+            "the pure Python implementation will be used ({})".format(e),
+            file=sys.stderr,
+        )
+
+
+def generate_tables():
+    from ansel.encodings import generate
+
+    generate.main([])
+
+
+def build(setup_kwargs):
+    generate_tables()
+    if platform.python_implementation() != "CPython":
+        return
+    setup_kwargs.update(
+        {"ext_modules": ext_modules, "cmdclass": {"build_ext": OptionalBuildExt}}
+    )
+
+
+if __name__ == "__main__":
+    # Build the extension in place for development, e.g. `python build.py`.
+    generate_tables()
+    distribution = Distribution({"name": "ansel", "ext_modules": ext_modules})
+    with tempfile.TemporaryDirectory() as build_temp:
+        command = OptionalBuildExt(distribution)
+        command.inplace = True
+        command.build_temp = command.build_lib = build_temp
+        command.ensure_finalized()
+        command.run()
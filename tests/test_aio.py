@@ -0,0 +1,163 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+import ansel.aio
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def make_reader(chunks, **kwargs):
+    stream = asyncio.StreamReader()
+    for chunk in chunks:
+        stream.feed_data(chunk)
+    stream.feed_eof()
+    return ansel.aio.AnselStreamReader(stream, **kwargs)
+
+
+class FakeStreamWriter:
+    def __init__(self):
+        self.data = b""
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([], ""),
+        ([b"P\xEAal"], "Pa\u030Al"),
+        ([b"P\xEA", b"al"], "Pa\u030Al"),
+        ([b"P\xE2", b"\xEA", b"al\n"], "Pa\u030A\u0301l\n"),
+        ([b"ab\xE2"], "ab \u0301"),
+    ],
+)
+def test_read(chunks, expected):
+    async def read():
+        reader = make_reader(chunks)
+        parts = []
+        while True:
+            text = await reader.read(2)
+            if not text:
+                return parts
+            parts.append(text)
+
+    parts = run(read())
+    assert expected == "".join(parts)
+
+
+def test_read_all():
+    async def read():
+        return await make_reader([b"P\xEA", b"al"]).read()
+
+    assert "Pa\u030Al" == run(read())
+
+
+def test_read_nothing():
+    async def read():
+        reader = make_reader([b" \xE2a"])
+        return [await reader.read(2), await reader.read(0), await reader.read()]
+
+    assert [" ", "", "a\u0301"] == run(read())
+
+
+def test_readline():
+    async def read():
+        reader = make_reader([b"0 HEAD\n1 NAME P\xEA", b"al\n0 TRLR"])
+        return [line async for line in reader]
+
+    assert ["0 HEAD\n", "1 NAME Pa\u030Al\n", "0 TRLR"] == run(read())
+
+
+@pytest.mark.parametrize(
+    "chunks, expected",
+    [
+        ([b"a\rb\rc"], ["a\r", "b\r", "c"]),
+        ([b"a\r\nb\r\n"], ["a\r\n", "b\r\n"]),
+        ([b"a\r", b"\nb\r"], ["a\r\n", "b\r"]),
+        ([b"a\r", b"b\n\n"], ["a\r", "b\n", "\n"]),
+        ([b"a\xE2", b"\rb"], ["a \u0301\r", "b"]),
+    ],
+)
+def test_readline_line_breaks(chunks, expected):
+    async def read():
+        reader = make_reader(chunks)
+        return [line async for line in reader]
+
+    assert expected == run(read())
+
+
+def test_readline_carriage_returns_only():
+    lines = [b"1 NOTE " + b"x" * 100 + b"\r"] * 2000
+
+    async def read():
+        reader = make_reader([b"".join(lines)])
+        return [line async for line in reader]
+
+    assert [line.decode("ascii") for line in lines] == run(read())
+
+
+def test_read_after_readline():
+    async def read():
+        reader = make_reader([b"0 HEAD\r1 CHAR ANSEL\r0 TRLR\r"])
+        line = await reader.readline()
+        assert not reader.at_eof()
+        return line, await reader.read(), reader.at_eof()
+
+    assert ("0 HEAD\r", "1 CHAR ANSEL\r0 TRLR\r", True) == run(read())
+
+
+def test_read_with_executor():
+    async def read():
+        reader = make_reader([b"P\xEA", b"al" * 10], executor=executor, offload_size=4)
+        return await reader.read(), await reader.read()
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        assert ("Pa\u030Al" + "al" * 9, "") == run(read())
+
+
+def test_read_invalid():
+    async def read():
+        return await make_reader([b"ab\xFD"]).read()
+
+    with pytest.raises(UnicodeDecodeError):
+        run(read())
+
+
+def test_write():
+    stream = FakeStreamWriter()
+    writer = ansel.aio.AnselStreamWriter(stream)
+
+    async def write():
+        writer.write("Pa")
+        writer.write("\u030Al")
+        writer.writelines(["\n", "Zoe", "\u0308"])
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    run(write())
+    assert b"P\xEAal\nZo\xE8e" == stream.data
+    assert stream.closed
+
+
+def test_write_invalid():
+    writer = ansel.aio.AnselStreamWriter(FakeStreamWriter(), errors="replace")
+    writer.write("a\u4E00")
+    writer.flush()
+    assert b"a?" == writer.writer.data
@@ -3,9 +3,13 @@
 """Tests for `ansel` package."""
 
 import codecs
+import subprocess
+import sys
 
 import pytest
 
+from ansel.encodings import ansel as ansel_encoding
+
 
 def test_lookup(register):
     codec_info = codecs.lookup("ansel")
@@ -13,18 +17,34 @@ def test_lookup(register):
     assert "ansel" == codec_info.name
 
 
+def test_import_is_lazy():
+    modules = [
+        "ansel.encodings.ansel",
+        "ansel.encodings.generate",
+        "concurrent.futures",
+        "multiprocessing",
+    ]
+    code = "import sys, ansel; print(*(m for m in {!r} if m in sys.modules))"
+    output = subprocess.check_output(
+        [sys.executable, "-c", code.format(modules)], universal_newlines=True
+    )
+    assert "" == output.strip()
+
+
+def test_tables():
+    assert "\u00C6" == ansel_encoding.ANSEL_TO_UNICODE[0xA5]
+    assert "\u0301" == ansel_encoding.ANSEL_TO_UNICODE_MODIFIERS[0xE2]
+    assert "\u001B" == ansel_encoding.ANSEL_TO_UNICODE_CONTROL[0x1B]
+    assert b"\xA5" == ansel_encoding.UNICODE_TO_ANSEL["\u00C6"]
+    assert b"\xE2" == ansel_encoding.UNICODE_TO_ANSEL_MODIFIERS["\u0301"]
+
+
 @pytest.mark.parametrize(
     "input, expected",
     [
         (b"", ""),
         (b"abc", "abc"),
-        pytest.param(
-            b"P\xEAal",
-            "Pa\u030Al",
-            marks=pytest.mark.xfail(
-                reason="Incremental reads not supported through stream interface"
-            ),
-        ),
+        (b"P\xEAal", "Pa\u030Al"),
     ],
 )
 def test_decode(register, fs, input, expected):
@@ -47,13 +67,7 @@ def test_decode(register, fs, input, expected):
         (["abc"], b"abc"),
         (["Pa\u030Al"], b"P\xEAal"),
         (["P", "a\u030A", "l"], b"P\xEAal"),
-        pytest.param(
-            ["P", "a", "\u030A", "l"],
-            b"P\xEAal",
-            marks=pytest.mark.xfail(
-                reason="Incremental writes not supported through stream interface"
-            ),
-        ),
+        (["P", "a", "\u030A", "l"], b"P\xEAal"),
     ],
 )
 def test_encode(register, fs, input_parts, expected):
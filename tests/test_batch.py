@@ -0,0 +1,71 @@
+import pytest
+
+import ansel
+from ansel.encodings import lookup
+
+ENCODED = [b"", b"abc", b"P\xEAal", b"\xE2\xEAa\xE2", b"\xBE\xFC=", b"Zo\xE8e\n"]
+DECODED = [
+    "",
+    "abc",
+    "Pa\u030Al",
+    "a\u030A\u0301 \u0301",
+    "\u25A1=\u0338",
+    "Zoe\u0308\n",
+]
+
+
+@pytest.mark.parametrize("encoding", ["ansel", "gedcom"])
+def test_decode_many(encoding):
+    codec_info = lookup(encoding)
+    expected = [codec_info.decode(input, "replace")[0] for input in ENCODED]
+
+    assert expected == ansel.decode_many(ENCODED, encoding, "replace")
+
+
+def test_decode_many_values():
+    assert DECODED == ansel.decode_many(iter(ENCODED))
+
+
+def test_decode_many_buffers():
+    inputs = [bytearray(b"P\xEAal"), memoryview(b"xP\xEAal")[1:]]
+
+    assert ["Pa\u030Al", "Pa\u030Al"] == ansel.decode_many(inputs)
+
+
+def test_decode_many_builtin_encoding():
+    assert ["P\u00E5l", ""] == ansel.decode_many([b"P\xC3\xA5l", b""], "utf-8")
+
+
+def test_decode_many_invalid():
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        ansel.decode_many([b"abc", b"a\xFD"])
+    assert b"a\xFD" == exc_info.value.object
+    assert 1 == exc_info.value.start
+
+
+def test_decode_many_with_replacement():
+    assert ["a\uFFFD", "b"] == ansel.decode_many([b"a\xFD", b"b"], errors="replace")
+
+
+@pytest.mark.parametrize("encoding", ["ansel", "gedcom"])
+def test_encode_many(encoding):
+    codec_info = lookup(encoding)
+    inputs = DECODED + ["\u00DF\u2260", "a\u4E00"]
+    expected = [codec_info.encode(input, "replace")[0] for input in inputs]
+
+    assert expected == ansel.encode_many(inputs, encoding, "replace")
+
+
+def test_encode_many_values():
+    assert [b"", b"abc", b"P\xEAal", b"\xEAa"] == ansel.encode_many(
+        ["", "abc", "Pa\u030Al", "a\u030A"]
+    )
+
+
+def test_encode_many_builtin_encoding():
+    assert [b"P\xC3\xA5l"] == ansel.encode_many(["P\u00E5l"], "utf-8")
+
+
+def test_encode_many_invalid():
+    with pytest.raises(UnicodeEncodeError):
+        ansel.encode_many(["abc", "a\u4E00"])
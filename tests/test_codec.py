@@ -1,3 +1,8 @@
+import codecs
+import gzip
+import io
+import os
+
 import pytest
 
 import ansel.codec
@@ -14,6 +19,26 @@ class Codec(ansel.codec.Codec):
     decode_control_map = {ord(b"\n"): "8", ord(b"\t"): "9A"}
 
 
+class StreamReader(Codec, ansel.codec.StreamReader):
+    decode_control_map = {ord(b"\n"): "\n", ord(b"\r"): "\r"}
+
+
+class StreamWriter(Codec, ansel.codec.StreamWriter):
+    pass
+
+
+class UnseekableStream(io.RawIOBase):
+    def __init__(self):
+        self.data = b""
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += bytes(b)
+        return len(b)
+
+
 @pytest.mark.parametrize(
     "input, expected, expected_len",
     [("", b"", 0), ("a", b"1", 1), ("b", b"23", 1), ("ab", b"123", 2)],
@@ -174,3 +199,214 @@ def test_decode_invalid_with_replacement(input, expected, expected_len):
     output, output_len = codec.decode(input, errors="replace")
     assert expected == output
     assert expected_len == output_len
+
+
+@pytest.mark.parametrize(
+    "input, expected, expected_len",
+    [
+        (bytearray(b"na"), "15", 2),
+        (memoryview(b"-na-")[1:3], "15", 2),
+        (memoryview(b"nana").cast("H"), "1515", 4),
+    ],
+)
+def test_decode_buffer(input, expected, expected_len):
+    codec = Codec()
+    output, output_len = codec.decode(input)
+    assert expected == output
+    assert expected_len == output_len
+
+
+STREAM_WRITER_CASES = [
+    ([], b""),
+    (["a", "b"], b"123"),
+    (["a", "n"], b"51"),
+    (["a", "n", "", "o", "b"], b"675123"),
+    (["an", "ob"], b"675123"),
+    (["n", "a"], b"51"),
+    (["bn", "n"], b"5523"),
+]
+
+
+@pytest.mark.parametrize("input_parts, expected", STREAM_WRITER_CASES)
+def test_stream_writer(input_parts, expected):
+    stream = io.BytesIO()
+    writer = StreamWriter(stream)
+    written = ""
+    for part in input_parts:
+        writer.write(part)
+        written += part
+        # Everything written so far is in the stream without a reset.
+        assert Codec().encode(written)[0] == stream.getvalue()
+    assert expected == stream.getvalue()
+
+
+@pytest.mark.parametrize("input_parts, expected", STREAM_WRITER_CASES)
+def test_stream_writer_unseekable(input_parts, expected):
+    stream = UnseekableStream()
+    with StreamWriter(stream) as writer:
+        for part in input_parts:
+            writer.write(part)
+    assert expected == stream.data
+    assert stream.closed
+
+
+def test_stream_writer_append(tmp_path):
+    path = tmp_path / "text"
+    path.write_bytes(b"x")
+    with open(str(path), "ab") as fp:
+        writer = StreamWriter(fp)
+        writer.write("a")
+        writer.write("n")
+        writer.reset()
+        writer.write("b")
+        writer.close()
+    assert b"x1523" == path.read_bytes()
+
+
+def test_stream_writer_codecs_open_append(register, tmp_path):
+    path = str(tmp_path / "text")
+    with codecs.open(path, "w", encoding="ansel") as fp:
+        fp.write("Pa\u030A")
+    # codecs.open closes the file itself, without closing the writer.
+    with codecs.open(path, "a", encoding="ansel") as fp:
+        fp.write("l ")
+        fp.write("Smith")
+    with open(path, "rb") as fp:
+        assert b"P\xEAal Smith" == fp.read()
+
+
+def test_stream_writer_gzip(register, tmp_path):
+    path = str(tmp_path / "text.gz")
+    with gzip.open(path, "wb") as fp:
+        with codecs.getwriter("ansel")(fp) as writer:
+            writer.write("Pa")
+            writer.write("\u030Al")
+            writer.write(" Smith")
+    with gzip.open(path, "rb") as fp:
+        assert b"P\xEAal Smith" == fp.read()
+
+
+@pytest.mark.parametrize("mode, expected", [("wb", True), ("w+b", True), ("ab", False)])
+def test_can_rewrite_file(tmp_path, mode, expected):
+    with open(str(tmp_path / "text"), mode) as fp:
+        assert expected == ansel.codec.can_rewrite(fp)
+        assert expected == ansel.codec.can_rewrite(fp.raw)
+
+
+def test_can_rewrite_pipe():
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    with open(write_fd, "wb") as fp:
+        assert not ansel.codec.can_rewrite(fp)
+
+
+def test_can_rewrite_gzip(tmp_path):
+    with gzip.open(str(tmp_path / "text.gz"), "wb") as fp:
+        assert fp.seekable()
+        assert not ansel.codec.can_rewrite(fp)
+
+
+def test_stream_writer_reset():
+    stream = UnseekableStream()
+    writer = StreamWriter(stream)
+    writer.write("a")
+    assert b"" == stream.data
+    writer.reset()
+    assert b"1" == stream.data
+    writer.write("n")
+    writer.reset()
+    assert b"15" == stream.data
+
+
+@pytest.mark.parametrize("size", [-1, 1, 2, 1024])
+@pytest.mark.parametrize(
+    "input, expected",
+    [(b"", ""), (b"ab", "123"), (b"nab\n", "1523\n"), (b"aon", "1 567")],
+)
+def test_stream_reader_read(size, input, expected):
+    reader = StreamReader(io.BytesIO(input))
+    parts = []
+    part = reader.read(size)
+    while part:
+        parts.append(part)
+        part = reader.read(size)
+    assert expected == "".join(parts)
+
+
+@pytest.mark.parametrize("chars", [1, 2, 3])
+def test_stream_reader_read_chars(chars):
+    reader = StreamReader(io.BytesIO(b"nabab"))
+    parts = []
+    part = reader.read(1, chars)
+    while part:
+        assert len(part) <= chars
+        parts.append(part)
+        part = reader.read(1, chars)
+    assert "1523123" == "".join(parts)
+
+
+@pytest.mark.parametrize("size, chars", [(0, -1), (1, 0), (-1, 0)])
+def test_stream_reader_read_nothing(size, chars):
+    reader = StreamReader(io.BytesIO(b"anb"))
+    assert "1" == reader.read(2)
+    assert "" == reader.read(size, chars)
+    assert "235" == reader.read()
+
+
+def test_stream_reader_readline_size_0():
+    reader = StreamReader(io.BytesIO(b"anb\n"))
+    assert "1" == reader.read(2)
+    assert "235\n" == reader.readline(0)
+
+
+@pytest.mark.parametrize("size", [None, 1, 2, 1024])
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (b"", []),
+        (b"a", ["1"]),
+        (b"a\nb", ["1\n", "23"]),
+        (b"a\r\nb\rna\n\n", ["1\r\n", "23\r", "15\n", "\n"]),
+        (b"a\r", ["1\r"]),
+        (b"\r\r\n\n", ["\r", "\r\n", "\n"]),
+    ],
+)
+def test_stream_reader_readline(size, input, expected):
+    reader = StreamReader(io.BytesIO(input))
+    lines = []
+    line = reader.readline(size)
+    while line:
+        lines.append(line)
+        line = reader.readline(size)
+    assert expected == lines
+
+
+def test_stream_reader_readline_keepends():
+    reader = StreamReader(io.BytesIO(b"a\r\nb\n"))
+    assert "1" == reader.readline(keepends=False)
+    assert "23" == reader.readline(keepends=False)
+    assert "" == reader.readline(keepends=False)
+
+
+def test_stream_reader_mixed():
+    reader = StreamReader(io.BytesIO(b"ab\nbna\na"))
+    assert "1" == reader.read(1, 1)
+    assert "23\n" == reader.readline()
+    assert ["23", "15\n", "1"] == [reader.read(2, 2)] + list(reader)
+
+
+def test_stream_reader_seek():
+    reader = StreamReader(io.BytesIO(b"a\nnb"))
+    assert "1\n" == reader.readline()
+    reader.seek(0)
+    assert ["1\n", "235"] == reader.readlines()
+
+
+def test_stream_reader_iter_and_readline():
+    reader = StreamReader(io.BytesIO(b"a\nb\nna\nab\n"))
+    lines = []
+    for line in reader:
+        lines.append(line)
+        if line == "1\n":
+            lines.append(reader.readline())
+    assert ["1\n", "23\n", "15\n", "123\n"] == lines
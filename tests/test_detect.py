@@ -0,0 +1,89 @@
+import codecs
+import io
+
+import pytest
+
+import ansel
+
+HEAD = b"0 HEAD\r\n1 SOUR X\r\n1 CHAR {}\r\n2 VERS 1\r\n0 @I1@ INDI\r\n"
+
+
+class UnseekableStream(io.RawIOBase):
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.data.readinto(b)
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"", "gedcom"),
+        (b"0 HEAD\n1 SOUR X\n", "gedcom"),
+        (HEAD.replace(b"{}", b"ANSEL"), "gedcom"),
+        (HEAD.replace(b"{}", b"UTF-8"), "utf-8"),
+        (HEAD.replace(b"{}", b"utf-8 "), "utf-8"),
+        (HEAD.replace(b"{}", b"ASCII"), "ascii"),
+        (HEAD.replace(b"{}", b"ANSI"), "cp1252"),
+        (HEAD.replace(b"{}", b"UNKNOWN"), "gedcom"),
+        (b"  0 HEAD\n  1 CHAR UTF-8\n", "utf-8"),
+        (b"0 HEAD\n0 @I1@ INDI\n1 CHAR UTF-8\n", "gedcom"),
+        (b"0 HEAD\n1 SOUR X\n2 CHAR UTF-8\n", "gedcom"),
+        (codecs.BOM_UTF8 + HEAD.replace(b"{}", b"ANSEL"), "utf-8-sig"),
+        ("0 HEAD\n".encode("utf-16"), "utf-16"),
+        ("0 HEAD\n".encode("utf-16-le"), "utf-16-le"),
+        ("0 HEAD\n".encode("utf-16-be"), "utf-16-be"),
+    ],
+)
+def test_detect_encoding(data, expected):
+    assert expected == ansel.detect_encoding(data)
+
+
+def test_detect_encoding_default():
+    assert "utf-8" == ansel.detect_encoding(b"0 HEAD\n", default="utf-8")
+
+
+@pytest.mark.parametrize(
+    "charset, encoding",
+    [("ANSEL", "gedcom"), ("UTF-8", "utf-8"), ("UNICODE", "utf-16")],
+)
+def test_open_gedcom(charset, encoding):
+    text = HEAD.decode("ascii").format(charset) + "1 NAME Pa\u030Al\r\n" * 2000
+    data = ansel.encodings.lookup(encoding).encode(text)[0]
+
+    with ansel.open_gedcom(UnseekableStream(data)) as fp:
+        assert encoding == fp.encoding
+        assert text.replace("\r\n", "\n") == fp.read()
+
+
+def test_open_gedcom_path(tmp_path):
+    path = tmp_path / "text.ged"
+    path.write_bytes(b"0 HEAD\n1 CHAR ANSEL\n0 @I1@ INDI\n1 NAME P\xEAal\n")
+
+    with ansel.open_gedcom(path, newline="") as fp:
+        assert "gedcom" == fp.encoding
+        assert [
+            "0 HEAD\n",
+            "1 CHAR ANSEL\n",
+            "0 @I1@ INDI\n",
+            "1 NAME Pa\u030Al\n",
+        ] == list(fp)
+
+
+def test_open_gedcom_long_head():
+    data = b"0 HEAD\n" + b"1 NOTE x\n" * 10000 + b"1 CHAR UTF-8\n"
+
+    with ansel.open_gedcom(io.BytesIO(data)) as fp:
+        assert "gedcom" == fp.encoding
+        assert data.decode("ascii") == fp.read()
+
+
+def test_open_gedcom_errors():
+    data = b"0 HEAD\n1 CHAR ANSEL\n1 NOTE \xFD\n"
+
+    with ansel.open_gedcom(io.BytesIO(data), errors="replace") as fp:
+        assert "0 HEAD\n1 CHAR ANSEL\n1 NOTE \uFFFD\n" == fp.read()
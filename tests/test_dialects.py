@@ -0,0 +1,83 @@
+import codecs
+
+import pytest
+
+import ansel
+from ansel.encodings import gedcom, lookup
+
+
+def test_define_dialect(register):
+    codec_info = ansel.define_dialect(
+        "test_ballot",
+        """
+        0xBE  U+2610  char                   # BALLOT BOX
+        0xBF  U+2611  char                   # BALLOT BOX WITH CHECK
+        0xFD  U+0301  modifier  decode-only  # COMBINING ACUTE ACCENT
+        """,
+    )
+    assert "test_ballot" == codec_info.name
+    assert codec_info is lookup("test_ballot")
+    assert codec_info is codecs.lookup("test_ballot")
+
+    assert "\u2610\u2611\u00DFe\u0301e\u0301" == codecs.decode(
+        b"\xBE\xBF\xCF\xE2e\xFDe", "test_ballot"
+    )
+    assert b"\xBE\xBF\xCF\xE2e\xE2e" == codecs.encode(
+        "\u2610\u2611\u00DF\u00E9e\u0301", "test_ballot"
+    )
+
+
+def test_define_dialect_of_dialect():
+    ansel.define_dialect("test_base", "0xBE  U+2610  char")
+    ansel.define_dialect("test_derived", "0xC7  U+00E5  char", base="test_base")
+    # U+00E5 is encoded by its own byte rather than its decomposition.
+    assert b"\xBE\xC7\xEAa" == codecs.encode("\u2610\u00E5a\u030A", "test_derived")
+
+
+def test_define_dialect_tables():
+    codec_info = ansel.define_dialect("test_tables", "")
+    decoder_class = codec_info.incrementaldecoder
+    encoder_class = codec_info.incrementalencoder
+    assert gedcom.IncrementalDecoder.decode_table == decoder_class.decode_table
+    assert gedcom.IncrementalEncoder.encode_char_map == encoder_class.encode_char_map
+    for base_class, dialect_class in [
+        (gedcom.IncrementalDecoder, decoder_class),
+        (gedcom.IncrementalEncoder, encoder_class),
+    ]:
+        base_pattern = base_class.passthrough_pattern.pattern
+        assert base_pattern == dialect_class.passthrough_pattern.pattern
+
+
+def test_define_dialect_classes():
+    codec_info = ansel.define_dialect("test_classes", "0xBE  U+2610  char")
+    stream_reader = codec_info.streamreader
+    assert codec_info.incrementaldecoder is stream_reader.incrementaldecoder
+    assert codec_info.incrementalencoder is codec_info.streamwriter.incrementalencoder
+
+
+@pytest.mark.parametrize(
+    "name, definition, base, message",
+    [
+        ("Test", "", "gedcom", "invalid dialect name"),
+        ("test-dash", "", "gedcom", "invalid dialect name"),
+        ("gedcom", "", "ansel", "'gedcom' is already defined"),
+        ("utf_8", "", "gedcom", "'utf_8' is already defined"),
+        ("test_error", "", "utf_8", "unknown base encoding"),
+        ("test_error", "\n0xBE U+2610", "gedcom", "line 2: invalid mapping"),
+        ("test_error", "0xBE U+0301 char", "gedcom", "line 1: U\\+0301 is a comb"),
+        ("test_error", "0xBE U+0065 char", "gedcom", "line 1: U\\+0065 is already"),
+        ("test_error", "[other]", "gedcom", "can't start other sections"),
+    ],
+)
+def test_define_dialect_invalid(name, definition, base, message):
+    with pytest.raises(ValueError, match=message):
+        ansel.define_dialect(name, definition, base)
+
+
+def test_define_dialect_after_error():
+    with pytest.raises(ValueError):
+        ansel.define_dialect("test_retry", "0xBE U+0065 char")
+    with pytest.raises(LookupError):
+        lookup("test_retry")
+    ansel.define_dialect("test_retry", "0xBE U+2610 char")
+    assert "\u2610" == codecs.decode(b"\xBE", "test_retry")
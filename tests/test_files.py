@@ -0,0 +1,61 @@
+import pytest
+
+import ansel
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (b"", ""),
+        (b"abc", "abc"),
+        (b"P\xEAal", "Pa\u030Al"),
+        (b"P\xE2\xEAal\n", "Pa\u030A\u0301l\n"),
+        (b"\xBE\xFC=", "\u25A1=\u0338"),
+        (b"abc\xE2", "abc \u0301"),
+    ],
+)
+def test_decode_file(tmp_path, chunk_size, input, expected):
+    path = tmp_path / "text.gedcom"
+    path.write_bytes(input)
+
+    chunks = list(ansel.decode_file(str(path), chunk_size=chunk_size))
+
+    assert expected == "".join(chunks)
+    assert all(chunks)
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (b"P\xEAal", ["P", "a\u030A", "l"]),
+        (b"\xE2\xEAab", ["a\u030A\u0301", "b"]),
+    ],
+)
+def test_decode_file_keeps_modifiers_with_base(tmp_path, input, expected):
+    path = tmp_path / "text.ansel"
+    path.write_bytes(input)
+
+    assert expected == list(ansel.decode_file(str(path), "ansel", chunk_size=1))
+
+
+def test_decode_file_builtin_encoding(tmp_path):
+    path = tmp_path / "text.txt"
+    path.write_bytes("P\u00E5l".encode("utf-8"))
+
+    assert "P\u00E5l" == "".join(ansel.decode_file(str(path), "utf-8"))
+
+
+def test_decode_file_invalid(tmp_path):
+    path = tmp_path / "text.gedcom"
+    path.write_bytes(b"ab\xFD")
+
+    with pytest.raises(UnicodeDecodeError):
+        list(ansel.decode_file(str(path)))
+
+
+def test_decode_file_invalid_with_replacement(tmp_path):
+    path = tmp_path / "text.gedcom"
+    path.write_bytes(b"ab\xFD")
+
+    assert "ab\uFFFD" == "".join(ansel.decode_file(str(path), errors="replace"))
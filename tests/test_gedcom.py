@@ -3,9 +3,13 @@
 """Tests for `gedcom` package."""
 
 import codecs
+import io
+import pickle
 
 import pytest
 
+from ansel.encodings import gedcom
+
 
 def test_lookup(register):
     codec_info = codecs.lookup("gedcom")
@@ -13,18 +17,20 @@ def test_lookup(register):
     assert "gedcom" == codec_info.name
 
 
+def test_tables():
+    assert "\u25A1" == gedcom.GEDCOM_TO_UNICODE[0xBE]
+    assert "\u0301" == gedcom.GEDCOM_TO_UNICODE_MODIFIERS[0xE2]
+    assert "\u001B" == gedcom.GEDCOM_TO_UNICODE_CONTROL[0x1B]
+    assert b"\xBE" == gedcom.UNICODE_TO_GEDCOM["\u25A1"]
+    assert b"\xE2" == gedcom.UNICODE_TO_GEDCOM_MODIFIERS["\u0301"]
+
+
 @pytest.mark.parametrize(
     "input, expected",
     [
         (b"", ""),
         (b"abc", "abc"),
-        pytest.param(
-            b"P\xEAal",
-            "Pa\u030Al",
-            marks=pytest.mark.xfail(
-                reason="Incremental reads not supported through stream interface"
-            ),
-        ),
+        (b"P\xEAal", "Pa\u030Al"),
         (b"\xBE", "\u25A1"),
         (b"\xBF", "\u25A0"),
         (b"\xCD", "\u0065"),
@@ -52,13 +58,7 @@ def test_decode(register, fs, input, expected):
         (["abc"], b"abc"),
         (["Pa\u030Al"], b"P\xEAal"),
         (["P", "a\u030A", "l"], b"P\xEAal"),
-        pytest.param(
-            ["P", "a", "\u030A", "l"],
-            b"P\xEAal",
-            marks=pytest.mark.xfail(
-                reason="Incremental writes not supported through stream interface"
-            ),
-        ),
+        (["P", "a", "\u030A", "l"], b"P\xEAal"),
         ("\u25A1", b"\xBE"),
         ("\u25A0", b"\xBF"),
         ("\u0065", b"\x65"),
@@ -75,3 +75,34 @@ def test_encode(register, fs, input_parts, expected):
         contents = reader.read()
 
     assert expected == contents
+
+
+@pytest.mark.parametrize(
+    "input",
+    [b"\xE2a\n", b"\xE2\xE8a\nb\n", b"x\xE2\xE8\xF2\xE3a\xE1b\n" * 3],
+)
+def test_text_io_tell_seek(register, input):
+    expected = input.decode("gedcom")
+    with io.TextIOWrapper(io.BytesIO(input), encoding="gedcom") as reader:
+        positions = []
+        while True:
+            positions.append(reader.tell())
+            if not reader.read(1):
+                break
+        for index, position in enumerate(positions):
+            reader.seek(position)
+            assert expected[index:] == reader.read()
+
+
+def test_pickle_incremental_codecs():
+    decoder = gedcom.IncrementalDecoder()
+    assert "P" == decoder.decode(b"P\xEA")
+    decoder = pickle.loads(pickle.dumps(decoder))
+    assert gedcom.IncrementalDecoder is type(decoder)
+    assert "a\u030Al" == decoder.decode(b"al", final=True)
+
+    encoder = gedcom.IncrementalEncoder()
+    assert b"P" == encoder.encode("Pa")
+    encoder = pickle.loads(pickle.dumps(encoder))
+    assert gedcom.IncrementalEncoder is type(encoder)
+    assert b"\xEAal" == encoder.encode("\u030Al", final=True)
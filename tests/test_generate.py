@@ -0,0 +1,87 @@
+import pytest
+
+from ansel import incremental
+from ansel.encodings import generate
+
+
+def build(*lines):
+    charsets = generate.parse(["[test]"] + list(lines))
+    return generate.build_tables(charsets["test"])
+
+
+def test_tables_up_to_date():
+    with open(generate.TARGET, encoding="utf-8") as fp:
+        assert generate.generate() == fp.read()
+
+
+def test_build_tables():
+    tables = build(
+        "0x0A  U+000A  control  # LINE FEED",
+        "0x41  U+0041  char  # LATIN CAPITAL LETTER A",
+        "0xE2  U+0301  modifier  # COMBINING ACUTE ACCENT",
+    )
+    assert {0x0A: "\n"} == tables.decode_control_map
+    assert {0x41: "A"} == tables.decode_char_map
+    assert {0xE2: "́"} == tables.decode_modifier_map
+    assert {"\n": b"\n", "A": b"A", "Á": b"\xE2A"} == tables.encode_char_map
+    assert {"́": b"\xE2", "́": b"\xE2"} == tables.encode_modifier_map
+    assert (incremental.DECODE_MODIFIER, "́") == tables.decode_table[0xE2]
+
+
+def test_build_tables_modifier_order():
+    tables = build(
+        "0x6F  U+006F  char",
+        "0xE3  U+0302  modifier",
+        "0xF2  U+0323  modifier",
+    )
+    # U+1ED9 is o followed by a dot below, then a circumflex.
+    assert b"\xE3\xF2o" == tables.encode_char_map["ộ"]
+
+
+def test_build_tables_decode_only():
+    tables = build("0x65  U+0065  char", "0xCD  U+0065  char  decode-only")
+    assert {0x65: "e", 0xCD: "e"} == tables.decode_char_map
+    assert b"e" == tables.encode_char_map["e"]
+
+
+def test_parse_base_section():
+    charsets = generate.parse(
+        ["[base]", "0x41  U+0041  char", "[derived: base]", "0x42  U+0042  char"]
+    )
+    assert [0x41] == sorted(charsets["base"])
+    assert [0x41, 0x42] == sorted(charsets["derived"])
+
+
+@pytest.mark.parametrize(
+    "lines, message",
+    [
+        (["0x41  U+0041  char"], "line 1: mapping outside a section"),
+        (["[test]", "0x41 U+0041 letter"], "line 2: invalid mapping"),
+        (["[test]", "[test]"], "line 2: duplicate section"),
+        (["[test: other]"], "line 1: unknown base section"),
+        (
+            ["[test]", "0x41  U+0041  char", "0x41  U+0042  char"],
+            "line 3: byte 0x41 is already mapped",
+        ),
+    ],
+)
+def test_parse_invalid(lines, message):
+    with pytest.raises(ValueError, match=message):
+        generate.parse(lines)
+
+
+@pytest.mark.parametrize(
+    "lines, message",
+    [
+        (["0xE2  U+0041  modifier"], "line 2: U\\+0041 is not a combining character"),
+        (["0xE2  U+0301  char"], "line 2: U\\+0301 is a combining character"),
+        (["0x41  U+0041  control"], "line 2: U\\+0041 is not a control character"),
+        (
+            ["0x41  U+0041  char", "0x61  U+0041  char"],
+            "line 3: U\\+0041 is already mapped",
+        ),
+    ],
+)
+def test_build_tables_invalid(lines, message):
+    with pytest.raises(ValueError, match=message):
+        build(*lines)
@@ -1,3 +1,6 @@
+import array
+import io
+
 import pytest
 
 import ansel.incremental
@@ -8,15 +11,15 @@ from .conftest import EncodingError
 class IncrementalDecoder(ansel.incremental.IncrementalDecoder):
     name = "test"
     encode_char_map = {"a": b"1", "b": b"23", "?": b"?"}
-    decode_char_map = {ord(b"a"): "1", ord(b"b"): "23"}
+    decode_char_map = {ord(b"a"): "1", ord(b"b"): "23", ord(b"x"): "x", ord(b"y"): "y"}
     encode_modifier_map = {"n": b"5", "o": b"67"}
     decode_modifier_map = {ord(b"n"): "5", ord(b"o"): "67"}
-    decode_control_map = {ord(b"\n"): "8", ord(b"\t"): "9A"}
+    decode_control_map = {ord(b"\n"): "8", ord(b"\t"): "9A", ord(b"\r"): "\r"}
 
 
 class IncrementalEncoder(ansel.incremental.IncrementalEncoder):
     name = "test"
-    encode_char_map = {"a": b"1", "b": b"23", "?": b"?"}
+    encode_char_map = {"a": b"1", "b": b"23", "?": b"?", "x": b"x", "y": b"y"}
     decode_char_map = {ord(b"a"): "1", ord(b"b"): "23"}
     encode_modifier_map = {"n": b"5", "o": b"67"}
     decode_modifier_map = {ord(b"n"): "5", ord(b"o"): "67"}
@@ -58,6 +61,26 @@ def test_encode_setstate(state, input, expected):
     assert 0 == encoder.getstate()
 
 
+@pytest.mark.parametrize("input", ["a", "an", "bon", "no"])
+def test_encode_state_round_trip(input):
+    encoder = IncrementalEncoder()
+    expected = encoder.encode(input + "nb", final=True)
+    encoder.encode(input)
+    state = encoder.getstate()
+    encoder.reset()
+    encoder.setstate(state)
+    assert state == encoder.getstate()
+    assert expected == encoder.encode("nb", final=True)
+
+
+def test_encode_reset():
+    encoder = IncrementalEncoder()
+    encoder.encode("an")
+    encoder.reset()
+    assert 0 == encoder.getstate()
+    assert b"23" == encoder.encode("b", final=True)
+
+
 @pytest.mark.parametrize(
     "input, expected, expected_len",
     [("", b"", 0), ("a", b"1", 1), ("b", b"23", 1), ("ab", b"123", 2)],
@@ -79,6 +102,8 @@ def test_encode_valid(input, expected, expected_len):
         ["an", "nb"],
         ["a", "n", "n", "b"],
         ["n", "o"],
+        ["xy", "nx"],
+        ["x", "yn", "o"],
     ],
 )
 def test_encode_incremental(partials):
@@ -108,6 +133,24 @@ def test_encode_valid_with_modifiers(input, expected, expected_len):
     assert 0 == encoder.getstate()
 
 
+@pytest.mark.parametrize(
+    "input, expected, expected_len",
+    [
+        ("xy", b"xy", 2),
+        ("axbya", b"1x23y1", 5),
+        ("xyn", b"x5y", 3),
+        ("xnyx", b"5xyx", 4),
+        ("xonyx", b"567xyx", 5),
+        ("anxy", b"51xy", 4),
+    ],
+)
+def test_encode_valid_with_passthrough(input, expected, expected_len):
+    encoder = IncrementalEncoder()
+    output = encoder.encode(input, final=True)
+    assert expected == output
+    assert 0 == encoder.getstate()
+
+
 @pytest.mark.parametrize(
     "input, start, end, reason",
     [
@@ -146,15 +189,99 @@ def test_encode_invalid_with_replacement(input, expected, expected_len):
     assert 0 == encoder.getstate()
 
 
+def test_encode_max_modifiers():
+    encoder = IncrementalEncoder()
+    encoder.max_modifiers = 2
+    with pytest.raises(UnicodeEncodeError) as exc_info:
+        encoder.encode("annn", final=True)
+    assert "too many combining characters" == exc_info.value.reason
+    assert 3 == exc_info.value.start
+    assert 4 == exc_info.value.end
+
+
+def test_encode_max_modifiers_with_replacement():
+    encoder = IncrementalEncoder(errors="replace")
+    encoder.max_modifiers = 2
+    assert b"551?23" == encoder.encode("annnb", final=True)
+
+
+@pytest.mark.parametrize(
+    "count", [ansel.incremental.MAX_MODIFIERS, ansel.incremental.MAX_MODIFIERS + 1]
+)
+def test_encode_default_max_modifiers(count):
+    encoder = IncrementalEncoder(errors="replace")
+    output = encoder.encode("a" + "n" * count, final=True)
+    assert b"5" * min(count, ansel.incremental.MAX_MODIFIERS) in output
+    assert (count > ansel.incremental.MAX_MODIFIERS) == (b"?" in output)
+
+
+class DecomposingEncoder(ansel.incremental.IncrementalEncoder):
+    name = "test"
+    encode_char_map = {"a": b"1", "u": b"u", "\u01B0": b"2", "?": b"?"}
+    encode_modifier_map = {"\u0301": b"5", "\u0323": b"6"}
+    decompose = True
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        ("\u00E1", b"51"),
+        ("\u00E1a", b"511"),
+        ("\u00E1\u0323", b"651"),
+        # The precomposed u with horn is used for u with horn and dot below.
+        ("\u1EF1", b"62"),
+        ("\u1EF1\u0301", b"562"),
+    ],
+)
+def test_encode_decompose(input, expected):
+    encoder = DecomposingEncoder()
+    assert expected == encoder.encode(input, final=True)
+
+
+@pytest.mark.parametrize("input", ["\u00E0", "\u00E7", "\u4E00"])
+def test_encode_decompose_undefined(input):
+    encoder = DecomposingEncoder()
+    with pytest.raises(UnicodeEncodeError) as exc_info:
+        encoder.encode(input, final=True)
+    assert "character maps to <undefined>" == exc_info.value.reason
+
+
+def test_encode_decompose_disabled():
+    encoder = DecomposingEncoder()
+    encoder.decompose = False
+    with pytest.raises(UnicodeEncodeError):
+        encoder.encode("\u00E1", final=True)
+
+
+def test_encode_decompose_max_modifiers():
+    encoder = DecomposingEncoder(errors="replace")
+    encoder.max_modifiers = 0
+    assert b"?" == encoder.encode("\u00E1", final=True)
+
+
+def test_encode_decompose_memoized():
+    DecomposingEncoder.decomposer.cache_clear()
+    encoder = DecomposingEncoder()
+    encoder.encode("\u00E1\u00E1\u00E1", final=True)
+    assert 1 == DecomposingEncoder.decomposer.cache_info().misses
+
+
+def test_encode_decompose_cache_bounded():
+    encoder = DecomposingEncoder(errors="replace")
+    size = ansel.incremental.DECOMPOSE_CACHE_SIZE
+    encoder.encode("".join(map(chr, range(0x4E00, 0x4E00 + size * 2))))
+    assert size == DecomposingEncoder.decomposer.cache_info().currsize
+
+
 @pytest.mark.parametrize(
     "input, state",
     [
         (b"", (b"", 0)),
         (b"a", (b"", 0)),
-        (b"n", (b"", 0x1000035)),
-        (b"no", (b"", 0x1000036000037000035)),
+        (b"n", (b"n", 0)),
+        (b"no", (b"no", 0)),
         (b"nob", (b"", 0)),
-        (b"ano", (b"", 0x1000036000037000035)),
+        (b"ano", (b"no", 0)),
     ],
 )
 def test_decode_getstate(input, state):
@@ -167,9 +294,9 @@ def test_decode_getstate(input, state):
     "state, input, expected",
     [
         ((b"", 0), b"", ""),
-        ((b"", 0x1000035), b"a", "15"),
-        ((b"", 0x1000035), b"na", "155"),
-        ((b"", 0x1000036000037), b"na", "1567"),
+        ((b"n", 0), b"a", "15"),
+        ((b"n", 0), b"na", "155"),
+        ((b"o", 0), b"na", "1567"),
     ],
 )
 def test_decode_setstate(state, input, expected):
@@ -181,6 +308,26 @@ def test_decode_setstate(state, input, expected):
     assert (b"", 0) == decoder.getstate()
 
 
+@pytest.mark.parametrize("input", [b"n", b"no", b"onn", b"n" * 30])
+def test_decode_state_round_trip(input):
+    decoder = IncrementalDecoder(errors="replace")
+    expected = decoder.decode(input + b"a", final=True)
+    decoder.decode(input)
+    state = decoder.getstate()
+    decoder.reset()
+    decoder.setstate(state)
+    assert state == decoder.getstate()
+    assert expected == decoder.decode(b"a", final=True)
+
+
+def test_decode_reset():
+    decoder = IncrementalDecoder()
+    decoder.decode(b"no")
+    decoder.reset()
+    assert (b"", 0) == decoder.getstate()
+    assert "1" == decoder.decode(b"a", final=True)
+
+
 @pytest.mark.parametrize(
     "input, expected, expected_len",
     [(b"", "", 0), (b"a", "1", 1), (b"b", "23", 1), (b"ab", "123", 2)],
@@ -204,6 +351,8 @@ def test_decode_valid(input, expected, expected_len):
         [b"n", b"o"],
         [b"a", b"n", b"\n"],
         [b"b", b"o", b"\t", b"a"],
+        [b"xn", b"yx"],
+        [b"xy", b"n", b"\rx"],
     ],
 )
 def test_decode_incremental(partials):
@@ -263,6 +412,25 @@ def test_decode_valid_with_control_modifiers(input, expected, expected_len):
     assert (b"", 0) == decoder.getstate()
 
 
+@pytest.mark.parametrize(
+    "input, expected, expected_len",
+    [
+        (b"xy", "xy", 2),
+        (b"xy\rxy", "xy\rxy", 5),
+        (b"axbya", "1x23y1", 5),
+        (b"nxy", "x5y", 3),
+        (b"xnyx", "xy5x", 4),
+        (b"xon\ry", "x 567\ry", 5),
+        (b"x\nyn", "x8y 5", 4),
+    ],
+)
+def test_decode_valid_with_passthrough(input, expected, expected_len):
+    decoder = IncrementalDecoder()
+    output = decoder.decode(input, final=True)
+    assert expected == output
+    assert (b"", 0) == decoder.getstate()
+
+
 @pytest.mark.parametrize(
     "input, start, end, reason",
     [
@@ -299,3 +467,144 @@ def test_decode_invalid_with_replacement(input, expected, expected_len):
     output = decoder.decode(input)
     assert expected == output
     assert (b"", 0) == decoder.getstate()
+
+
+class ComposingDecoder(ansel.incremental.IncrementalDecoder):
+    name = "test"
+    decode_char_map = {ord(b"a"): "a", ord(b"u"): "\u01B0"}
+    decode_control_map = {ord(b"\n"): "\n"}
+    decode_modifier_map = {ord(b"n"): "\u0301", ord(b"o"): "\u0323"}
+    normalize = "NFC"
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (b"a", "a"),
+        (b"na", "\u00E1"),
+        (b"naa", "\u00E1a"),
+        (b"ona", "\u1EA1\u0301"),
+        # Combining characters are put in canonical order.
+        (b"nou", "\u1EF1\u0301"),
+        (b"n\n", " \u0301\n"),
+        (b"n", " \u0301"),
+    ],
+)
+def test_decode_normalize(input, expected):
+    decoder = ComposingDecoder()
+    assert expected == decoder.decode(input, final=True)
+
+
+def test_decode_normalize_split():
+    decoder = ComposingDecoder()
+    assert "" == decoder.decode(b"n")
+    assert "\u00E1" == decoder.decode(b"a", final=True)
+
+
+def test_decode_normalize_with_replacement():
+    decoder = ComposingDecoder(errors="replace")
+    assert "\uFFFD\u0301a" == decoder.decode(b"n+a", final=True)
+
+
+def test_decode_normalize_unsupported():
+    decoder = ComposingDecoder()
+    decoder.normalize = "NFKC"
+    with pytest.raises(ValueError):
+        decoder.decode(b"na")
+
+
+def test_decode_max_modifiers():
+    decoder = IncrementalDecoder()
+    decoder.max_modifiers = 2
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        decoder.decode(b"nnna", final=True)
+    assert "too many combining characters" == exc_info.value.reason
+    assert 2 == exc_info.value.start
+    assert 3 == exc_info.value.end
+
+
+def test_decode_max_modifiers_with_replacement():
+    decoder = IncrementalDecoder(errors="replace")
+    decoder.max_modifiers = 2
+    assert "\uFFFD551" == decoder.decode(b"nnna", final=True)
+
+
+@pytest.mark.parametrize(
+    "count", [ansel.incremental.MAX_MODIFIERS, ansel.incremental.MAX_MODIFIERS + 1]
+)
+def test_decode_default_max_modifiers(count):
+    decoder = IncrementalDecoder(errors="replace")
+    output = decoder.decode(b"n" * count + b"a", final=True)
+    assert "5" * min(count, ansel.incremental.MAX_MODIFIERS) in output
+    assert (count > ansel.incremental.MAX_MODIFIERS) == ("\uFFFD" in output)
+
+
+def test_decode_table():
+    decode_table = IncrementalDecoder.decode_table
+    assert 256 == len(decode_table)
+    assert (ansel.incremental.DECODE_CHAR, "1") == decode_table[ord(b"a")]
+    assert (ansel.incremental.DECODE_CONTROL, "9A") == decode_table[ord(b"\t")]
+    assert (ansel.incremental.DECODE_MODIFIER, "67") == decode_table[ord(b"o")]
+    assert (ansel.incremental.DECODE_UNDEFINED, None) == decode_table[ord(b"+")]
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        bytearray(b"xnab"),
+        memoryview(b"xnab"),
+        memoryview(b"--xnab--")[2:6],
+        memoryview(b"xnab").cast("c"),
+        array.array("B", b"xnab"),
+        memoryview(b"x-n-a-b-")[::2],
+    ],
+)
+def test_decode_buffer(input):
+    decoder = IncrementalDecoder()
+    output = decoder.decode(input, final=True)
+    assert "x1523" == output
+    assert (b"", 0) == decoder.getstate()
+
+
+@pytest.mark.parametrize(
+    "input", [bytearray(b"ab+"), memoryview(b"ab+"), memoryview(b"-ab+-")[1:4]]
+)
+def test_decode_buffer_invalid(input):
+    decoder = IncrementalDecoder()
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        decoder.decode(input)
+    assert b"ab+" == exc_info.value.object
+    assert 2 == exc_info.value.start
+    assert 3 == exc_info.value.end
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 1024])
+@pytest.mark.parametrize(
+    "input, expected",
+    [(b"", ""), (b"ab", "123"), (b"xnab\n", "x15238"), (b"xon", "x 567")],
+)
+def test_decode_into(chunk_size, input, expected):
+    decoder = IncrementalDecoder()
+    out = io.StringIO()
+    written = decoder.decode_into(input, out, final=True, chunk_size=chunk_size)
+    assert expected == out.getvalue()
+    assert len(expected) == written
+    assert (b"", 0) == decoder.getstate()
+
+
+def test_decode_into_incremental():
+    decoder = IncrementalDecoder()
+    out = io.StringIO()
+    decoder.decode_into(b"xn", out, chunk_size=1)
+    assert (b"n", 0) == decoder.getstate()
+    decoder.decode_into(b"a", out, final=True, chunk_size=1)
+    assert "x15" == out.getvalue()
+
+
+def test_decode_into_invalid():
+    decoder = IncrementalDecoder()
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        decoder.decode_into(b"abab+", io.StringIO(), chunk_size=2)
+    assert b"abab+" == exc_info.value.object
+    assert 4 == exc_info.value.start
+    assert 5 == exc_info.value.end
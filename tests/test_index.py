@@ -0,0 +1,91 @@
+import random
+
+import pytest
+
+import ansel
+
+TEXT = b"0 HEAD\n1 NOTE P\xEAal \xE2\xEAa\xE2\n1 NAME Zo\xE8e\n0 TRLR\n\xE1"
+DECODED = (
+    "0 HEAD\n1 NOTE Pa\u030Al a\u030A\u0301 \u0301\n1 NAME Zoe\u0308\n0 TRLR\n \u0300"
+)
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "text.gedcom"
+    path.write_bytes(TEXT)
+    return path
+
+
+@pytest.mark.parametrize("every", [1, 2, 5, 1024])
+def test_build(path, every):
+    index = ansel.index.build(path, every=every)
+
+    assert len(DECODED) == index.length
+    assert (0, 0, (b"", 0)) == index.checkpoints[0]
+    assert len(TEXT) == index.checkpoints[-1][0]
+
+
+@pytest.mark.parametrize("every", [1, 2, 5, 1024])
+def test_seek(path, every):
+    index = ansel.index.build(path, every=every)
+
+    with index.open() as reader:
+        for offset in range(len(DECODED) + 1):
+            assert offset == reader.seek(offset)
+            assert DECODED[offset:] == reader.read()
+            assert len(DECODED) == reader.tell()
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_access(path, seed):
+    rng = random.Random(seed)
+    index = ansel.index.build(path, every=3)
+
+    with index.open() as reader:
+        for _ in range(50):
+            offset = rng.randrange(len(DECODED) + 1)
+            size = rng.randrange(-1, 10)
+            reader.seek(offset)
+            expected = DECODED[offset:] if size < 0 else DECODED[offset:][:size]
+            assert expected == reader.read(size)
+            assert offset + len(expected) == reader.tell()
+
+
+def test_seek_past_end(path):
+    with ansel.index.build(path, every=4).open() as reader:
+        assert len(DECODED) == reader.seek(len(DECODED) + 10)
+        assert "" == reader.read()
+
+
+def test_seek_negative(path):
+    with ansel.index.build(path).open() as reader:
+        with pytest.raises(ValueError):
+            reader.seek(-1)
+
+
+def test_read_sequential(path):
+    with ansel.index.build(path, every=2).open() as reader:
+        assert DECODED == "".join(iter(lambda: reader.read(3), ""))
+
+
+def test_builtin_encoding(tmp_path):
+    path = tmp_path / "text.txt"
+    text = "P\u00E5l \u4E00\u4E8C\u4E09"
+    path.write_bytes(text.encode("utf-8"))
+    index = ansel.index.build(path, "utf-8", every=1)
+
+    with index.open() as reader:
+        reader.seek(5)
+        assert text[5:] == reader.read()
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.gedcom"
+    path.write_bytes(b"")
+    index = ansel.index.build(path)
+
+    assert 0 == index.length
+    with index.open() as reader:
+        assert 0 == reader.seek(0)
+        assert "" == reader.read()
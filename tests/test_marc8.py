@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+"""Tests for `marc8` package."""
+
+import codecs
+
+import pytest
+
+
+def test_lookup(register):
+    codec_info = codecs.lookup("marc8")
+    assert codec_info is not None
+    assert "marc8" == codec_info.name
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        (b"", ""),
+        (b"abc", "abc"),
+        (b"P\xEAal", "Pa\u030Al"),
+        (b"\x88The\x89 cat", "\u0098The\u009C cat"),
+        (b"a\x8Db\x8Ec", "a\u200Db\u200Cc"),
+        (b"\xC7", "\u00DF"),
+        (b"\xC8", "\u20AC"),
+    ],
+)
+def test_decode(register, input, expected):
+    assert expected == codecs.decode(input, "marc8")
+
+
+@pytest.mark.parametrize(
+    "input, expected",
+    [
+        ("", b""),
+        ("abc", b"abc"),
+        ("Pa\u030Al", b"P\xEAal"),
+        ("P\u00E5l", b"P\xEAal"),
+        ("\u0098The\u009C cat", b"\x88The\x89 cat"),
+        ("\u00DF", b"\xC7"),
+        ("\u20AC", b"\xC8"),
+    ],
+)
+def test_encode(register, input, expected):
+    assert expected == codecs.encode(input, "marc8")
+
+
+@pytest.mark.parametrize("input", [b"\xBE", b"\xCF", b"\xFC"])
+def test_decode_gedcom_extensions(register, input):
+    with pytest.raises(UnicodeDecodeError):
+        codecs.decode(input, "marc8")
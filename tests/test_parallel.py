@@ -0,0 +1,183 @@
+import concurrent.futures
+import multiprocessing
+import sys
+
+import pytest
+
+import ansel.parallel
+from ansel.encodings import gedcom
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        yield executor
+
+
+@pytest.mark.parametrize(
+    "input, chunk_size, expected",
+    [
+        (b"", 2, [0, 0]),
+        (b"abcd", 2, [0, 2, 4]),
+        (b"abcd", 4, [0, 4]),
+        (b"a\xE1bcd", 2, [0, 3, 5]),
+        (b"\xE1\xE2ab", 1, [0, 3, 4]),
+        (b"ab\xE1", 2, [0, 2, 3]),
+    ],
+)
+def test_find_split_points(input, chunk_size, expected):
+    decode_table = gedcom.IncrementalDecoder.decode_table
+    assert expected == ansel.parallel.find_split_points(input, decode_table, chunk_size)
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        b"",
+        b"abc",
+        b"0 HEAD\n1 NAME P\xEAal /Sm\xE2\xE8ith/\n" * 10,
+        b"\xE1\xE2\xE3" * 10 + b"\n",
+        b"ab\xE1",
+    ],
+)
+def test_parallel_decode(executor, input):
+    expected = gedcom.Codec().decode(input)[0]
+    actual = ansel.parallel.parallel_decode(
+        input, workers=2, chunk_size=3, executor=executor
+    )
+    assert expected == actual
+
+
+def test_parallel_decode_invalid(executor):
+    input = b"0 HEAD\n" * 4 + b"\xFD" + b"0 TRLR\n"
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        ansel.parallel.parallel_decode(
+            input, workers=2, chunk_size=3, executor=executor
+        )
+    assert "gedcom" == exc_info.value.encoding
+    assert input == exc_info.value.object
+    assert 28 == exc_info.value.start
+    assert 29 == exc_info.value.end
+
+
+def test_parallel_decode_invalid_with_replacement(executor):
+    input = b"ab\xFDcd" * 4
+    actual = ansel.parallel.parallel_decode(
+        input, errors="replace", workers=2, chunk_size=3, executor=executor
+    )
+    assert "ab\uFFFDcd" * 4 == actual
+
+
+@pytest.mark.parametrize(
+    "errors, expected", [("replace", "b\uFFFDc"), ("strict", None)]
+)
+def test_decode_shared_chunk(errors, expected):
+    shared_memory = ansel.parallel.get_shared_memory()
+    if shared_memory is None:
+        pytest.skip("multiprocessing.shared_memory is unavailable")
+    buffer = shared_memory.SharedMemory(create=True, size=5)
+    try:
+        buffer.buf[:5] = b"ab\xFDcd"
+        if expected is None:
+            with pytest.raises(UnicodeDecodeError) as exc_info:
+                ansel.parallel._decode_shared_chunk(
+                    "gedcom", errors, [], buffer.name, 1, 4
+                )
+            assert b"b\xFDc" == exc_info.value.object
+            assert 1 == exc_info.value.start
+        else:
+            assert expected == ansel.parallel._decode_shared_chunk(
+                "gedcom", errors, [], buffer.name, 1, 4
+            )
+    finally:
+        buffer.close()
+        buffer.unlink()
+
+
+def test_parallel_decode_builtin_encoding():
+    input = "P\u00E5l".encode("utf-8")
+    assert "P\u00E5l" == ansel.parallel.parallel_decode(input, "utf-8", workers=2)
+
+
+@pytest.mark.parametrize(
+    "input, chunk_size, expected",
+    [
+        ("", 2, [0, 0]),
+        ("abcd", 2, [0, 2, 4]),
+        ("a\u0301bcd", 2, [0, 2, 4, 5]),
+        ("ab\u0301\u0300cd", 2, [0, 4, 6]),
+        ("ab\u0301", 2, [0, 3]),
+    ],
+)
+def test_find_text_split_points(input, chunk_size, expected):
+    encode_modifier_map = gedcom.IncrementalEncoder.encode_modifier_map
+    assert expected == ansel.parallel.find_text_split_points(
+        input, encode_modifier_map, chunk_size
+    )
+
+
+@pytest.mark.parametrize(
+    "input",
+    [
+        "",
+        "abc",
+        "0 HEAD\n1 NAME Pa\u030Al /Sm\u0301\u0308ith/\n" * 10,
+        "\u0300\u0301\u0302" * 10 + "\n",
+        "ab\u0300",
+        ["0 HEAD\n", "1 NAME Pa", "\u030Al\n", "0 TRLR\n"],
+    ],
+)
+def test_parallel_encode(executor, input):
+    expected = gedcom.Codec().encode("".join(input))[0]
+    actual = ansel.parallel.parallel_encode(
+        input, workers=2, chunk_size=3, executor=executor
+    )
+    assert expected == actual
+
+
+def test_parallel_encode_invalid(executor):
+    input = "0 HEAD\n" * 4 + "\u4E00" + "0 TRLR\n"
+    with pytest.raises(UnicodeEncodeError) as exc_info:
+        ansel.parallel.parallel_encode(
+            input, workers=2, chunk_size=3, executor=executor
+        )
+    assert "gedcom" == exc_info.value.encoding
+    assert input == exc_info.value.object
+    assert 28 == exc_info.value.start
+    assert 29 == exc_info.value.end
+
+
+def test_parallel_encode_invalid_with_replacement(executor):
+    input = "ab\u4E00\u0301cd" * 4
+    actual = ansel.parallel.parallel_encode(
+        input, errors="replace", workers=2, chunk_size=3, executor=executor
+    )
+    assert b"ab\xE2?cd" * 4 == actual
+
+
+def test_parallel_encode_builtin_encoding():
+    input = "P\u00E5l"
+    assert input.encode("utf-8") == ansel.parallel.parallel_encode(
+        input, "utf-8", workers=2
+    )
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="ProcessPoolExecutor has no mp_context"
+)
+def test_parallel_dialect_spawn():
+    ansel.define_dialect("test_parallel_base", "0xBE  U+2610  char")
+    ansel.define_dialect(
+        "test_parallel", "0xBF  U+2611  char", base="test_parallel_base"
+    )
+    data = b"\xBE\xBF P\xEAal\n" * 4
+    text = "\u2610\u2611 Pa\u030Al\n" * 4
+    context = multiprocessing.get_context("spawn")
+    with concurrent.futures.ProcessPoolExecutor(2, mp_context=context) as executor:
+        for _ in range(2):
+            assert text == ansel.parallel.parallel_decode(
+                data, "test_parallel", workers=2, chunk_size=3, executor=executor
+            )
+            assert data == ansel.parallel.parallel_encode(
+                text, "test_parallel", workers=2, chunk_size=3, executor=executor
+            )
@@ -0,0 +1,83 @@
+import io
+
+import pytest
+
+import ansel
+
+DATA = (
+    b"0 HEAD\r\n1 CHAR ANSEL\r\n"
+    b"0 @I1@ INDI\r\n1 NAME P\xEAal /Sm\xE2ith/\r\n"
+    b"  0 @I2@ INDI\r\n  1 NOTE 10 x\r\n"
+    b"0 TRLR"
+)
+RECORDS = [
+    b"0 HEAD\r\n1 CHAR ANSEL\r\n",
+    b"0 @I1@ INDI\r\n1 NAME P\xEAal /Sm\xE2ith/\r\n",
+    b"  0 @I2@ INDI\r\n  1 NOTE 10 x\r\n",
+    b"0 TRLR",
+]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 1024])
+def test_gedcom_records(chunk_size):
+    records = list(ansel.gedcom_records(io.BytesIO(DATA), chunk_size=chunk_size))
+
+    assert RECORDS == [record.data for record in records]
+    codec_info = ansel.encodings.lookup("gedcom")
+    assert [codec_info.decode(data)[0] for data in RECORDS] == [
+        record.text for record in records
+    ]
+
+
+def test_gedcom_records_lines():
+    records = list(ansel.gedcom_records(io.BytesIO(DATA)))
+
+    assert ["0 @I1@ INDI", "1 NAME Pa\u030Al /Smi\u0301th/"] == records[1].lines
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("", []),
+        ("0 TRLR", ["0 TRLR"]),
+        ("0 TRLR\r\n", ["0 TRLR"]),
+        (
+            "0 @N1@ NOTE a\x1Cb\x0C\r1 CONT \x85c\n\n",
+            ["0 @N1@ NOTE a\x1Cb\x0C", "1 CONT \x85c", ""],
+        ),
+    ],
+)
+def test_record_lines(text, expected):
+    assert expected == ansel.records.Record(b"", text).lines
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"", []),
+        (b"0 HEAD", [b"0 HEAD"]),
+        (b"\n0 HEAD\n", [b"\n", b"0 HEAD\n"]),
+        (b"0 A\n10 B\n0C\n\n0\tD\r0 E", [b"0 A\n10 B\n0C\n\n", b"0\tD\r", b"0 E"]),
+    ],
+)
+def test_gedcom_records_split(data, expected):
+    records = ansel.gedcom_records(io.BytesIO(data), chunk_size=2)
+
+    assert expected == [record.data for record in records]
+
+
+def test_gedcom_records_trailing_modifier():
+    records = list(ansel.gedcom_records(io.BytesIO(b"0 HEAD\n0 A\xE2")))
+
+    assert "0 A \u0301" == records[-1].text
+
+
+def test_gedcom_records_invalid():
+    with pytest.raises(UnicodeDecodeError):
+        list(ansel.gedcom_records(io.BytesIO(b"0 HEAD\n0 A\xFD\n")))
+
+
+def test_gedcom_records_with_replacement():
+    records = ansel.gedcom_records(io.BytesIO(b"0 A\xFD\n"), errors="replace")
+
+    assert ["0 A\uFFFD\n"] == [record.text for record in records]
@@ -0,0 +1,341 @@
+import codecs
+import random
+
+import pytest
+
+import ansel.incremental
+from ansel.encodings import ansel as ansel_encoding
+from ansel.encodings import gedcom
+
+from .conftest import EncodingError
+
+speedups = pytest.importorskip("ansel._speedups")
+
+
+@pytest.fixture(params=[ansel_encoding, gedcom], ids=["ansel", "gedcom"])
+def encoding(request):
+    return request.param
+
+
+def random_bytes(seed, length=200):
+    rng = random.Random(seed)
+    population = [b"a", b"Z", b" ", b"\n", b"\x1b", b"\xe1", b"\xe8", b"\xfc"]
+    population += [b"\xa5", b"\xcf", b"\xfd", b"\x80"]
+    return b"".join(rng.choice(population) for _ in range(length))
+
+
+def random_text(seed, length=200, extra=()):
+    rng = random.Random(seed)
+    population = ["a", "Z", " ", "\n", "\u00E9", "\u0301", "\u0308", "\u0338"]
+    population += ["\u00DF", "\u2260", "\u25A0", "\u4E00"]
+    population += extra
+    return "".join(rng.choice(population) for _ in range(length))
+
+
+def decode_with(
+    decode,
+    decoder_class,
+    input,
+    decoded_modifiers,
+    final,
+    errors,
+    max_modifiers=ansel.incremental.MAX_MODIFIERS,
+    composer=None,
+):
+    return decode(
+        decoder_class.name,
+        decoder_class.decode_table,
+        decoder_class.passthrough_pattern,
+        input,
+        list(decoded_modifiers),
+        max_modifiers,
+        final,
+        codecs.lookup_error(errors),
+        composer,
+    )
+
+
+def encode_with(
+    encode,
+    encoder_class,
+    input,
+    current_char,
+    final,
+    errors,
+    max_modifiers=ansel.incremental.MAX_MODIFIERS,
+    decomposer=None,
+):
+    return encode(
+        encoder_class.name,
+        encoder_class.encode_char_map,
+        encoder_class.encode_modifier_map,
+        encoder_class.passthrough_pattern,
+        input,
+        list(current_char),
+        max_modifiers,
+        final,
+        codecs.lookup_error(errors),
+        decomposer,
+    )
+
+
+@pytest.mark.parametrize("final", [False, True])
+@pytest.mark.parametrize("decoded_modifiers", [[], ["\u0301"], ["\u0301", "\u0308"]])
+@pytest.mark.parametrize("seed", range(5))
+def test_decode_matches_python(encoding, seed, final, decoded_modifiers):
+    input = random_bytes(seed)
+    expected = decode_with(
+        ansel.incremental.py_decode,
+        encoding.IncrementalDecoder,
+        input,
+        decoded_modifiers,
+        final,
+        "replace",
+    )
+    actual = decode_with(
+        speedups.decode,
+        encoding.IncrementalDecoder,
+        input,
+        decoded_modifiers,
+        final,
+        "replace",
+    )
+    assert expected == actual
+
+
+@pytest.mark.parametrize("final", [False, True])
+@pytest.mark.parametrize("current_char", [[], [b"a"], [b"a", b"\xe1"]])
+@pytest.mark.parametrize("seed", range(5))
+def test_encode_matches_python(encoding, seed, final, current_char):
+    input = random_text(seed)
+    expected = encode_with(
+        ansel.incremental.py_encode,
+        encoding.IncrementalEncoder,
+        input,
+        current_char,
+        final,
+        "replace",
+    )
+    actual = encode_with(
+        speedups.encode,
+        encoding.IncrementalEncoder,
+        input,
+        current_char,
+        final,
+        "replace",
+    )
+    assert expected == actual
+
+
+@pytest.mark.parametrize("input", [b"a\xfd", bytearray(b"a\xfd"), memoryview(b"a\xfd")])
+def test_decode_invalid(input):
+    with pytest.raises(UnicodeDecodeError) as exc_info:
+        decode_with(
+            speedups.decode, gedcom.IncrementalDecoder, input, [], True, "strict"
+        )
+    assert "gedcom" == exc_info.value.encoding
+    assert b"a\xfd" == exc_info.value.object
+    assert 1 == exc_info.value.start
+    assert 2 == exc_info.value.end
+
+
+def test_decode_invalid_raising_error_handler(error_handler):
+    with pytest.raises(EncodingError):
+        decode_with(
+            speedups.decode, gedcom.IncrementalDecoder, b"\xfd", [], True, "raises"
+        )
+
+
+def test_encode_invalid():
+    with pytest.raises(UnicodeEncodeError) as exc_info:
+        encode_with(
+            speedups.encode, gedcom.IncrementalEncoder, "a\u4E00", [], True, "strict"
+        )
+    assert "gedcom" == exc_info.value.encoding
+    assert "a\u4E00" == exc_info.value.object
+    assert 1 == exc_info.value.start
+    assert 2 == exc_info.value.end
+
+
+def test_encode_invalid_raising_error_handler(error_handler):
+    with pytest.raises(EncodingError):
+        encode_with(
+            speedups.encode, gedcom.IncrementalEncoder, "\u4E00", [], True, "raises"
+        )
+
+
+@pytest.mark.parametrize("max_modifiers", [0, 1, 2])
+@pytest.mark.parametrize("seed", range(5))
+def test_decode_max_modifiers_matches_python(encoding, seed, max_modifiers):
+    input = random_bytes(seed)
+    expected = decode_with(
+        ansel.incremental.py_decode,
+        encoding.IncrementalDecoder,
+        input,
+        [],
+        True,
+        "replace",
+        max_modifiers,
+    )
+    actual = decode_with(
+        speedups.decode,
+        encoding.IncrementalDecoder,
+        input,
+        [],
+        True,
+        "replace",
+        max_modifiers,
+    )
+    assert expected == actual
+
+
+@pytest.mark.parametrize("max_modifiers", [0, 1, 2])
+@pytest.mark.parametrize("seed", range(5))
+def test_encode_max_modifiers_matches_python(encoding, seed, max_modifiers):
+    input = random_text(seed)
+    expected = encode_with(
+        ansel.incremental.py_encode,
+        encoding.IncrementalEncoder,
+        input,
+        [],
+        False,
+        "replace",
+        max_modifiers,
+    )
+    actual = encode_with(
+        speedups.encode,
+        encoding.IncrementalEncoder,
+        input,
+        [],
+        False,
+        "replace",
+        max_modifiers,
+    )
+    assert expected == actual
+
+
+def test_decode_error_handler_using_other_tables():
+    decoder_class = gedcom.IncrementalDecoder
+    # More tables than the decoder caches, each decoding "e" differently.
+    tables = []
+    for index in range(10):
+        table = list(decoder_class.decode_table)
+        table[ord("e")] = table[ord(str(index))]
+        tables.append(tuple(table))
+
+    def error_handler(exc):
+        for table in tables:
+            speedups.decode(
+                "gedcom",
+                table,
+                decoder_class.passthrough_pattern,
+                b"\xe2e",
+                [],
+                ansel.incremental.MAX_MODIFIERS,
+                True,
+                codecs.lookup_error("strict"),
+            )
+        return ("?", exc.end)
+
+    assert ("?e\u0301?b\u0301", []) == speedups.decode(
+        "gedcom",
+        decoder_class.decode_table,
+        decoder_class.passthrough_pattern,
+        b"\xfd\xe2e\xfd\xe2b",
+        [],
+        ansel.incremental.MAX_MODIFIERS,
+        True,
+        error_handler,
+    )
+
+
+def test_encode_error_handler_using_other_maps():
+    encoder_class = gedcom.IncrementalEncoder
+    # More maps than the encoder caches, each encoding "e" differently.
+    char_maps = []
+    for index in range(10):
+        char_map = dict(encoder_class.encode_char_map)
+        char_map["e"] = str(index).encode()
+        char_maps.append(char_map)
+
+    def error_handler(exc):
+        for char_map in char_maps:
+            speedups.encode(
+                "gedcom",
+                char_map,
+                encoder_class.encode_modifier_map,
+                encoder_class.passthrough_pattern,
+                "e",
+                [],
+                ansel.incremental.MAX_MODIFIERS,
+                True,
+                codecs.lookup_error("strict"),
+            )
+        return ("?", exc.end)
+
+    assert (b"?e?e", []) == speedups.encode(
+        "gedcom",
+        encoder_class.encode_char_map,
+        encoder_class.encode_modifier_map,
+        encoder_class.passthrough_pattern,
+        "\u4E00e\u4E00e",
+        [],
+        ansel.incremental.MAX_MODIFIERS,
+        True,
+        error_handler,
+    )
+
+
+@pytest.mark.parametrize("max_modifiers", [0, 1, ansel.incremental.MAX_MODIFIERS])
+@pytest.mark.parametrize("seed", range(5))
+def test_encode_decompose_matches_python(encoding, seed, max_modifiers):
+    input = random_text(seed, extra=["\u1EDB", "\u1EF1"])
+    decomposer = encoding.IncrementalEncoder.decomposer
+    expected = encode_with(
+        ansel.incremental.py_encode,
+        encoding.IncrementalEncoder,
+        input,
+        [],
+        True,
+        "replace",
+        max_modifiers,
+        decomposer,
+    )
+    actual = encode_with(
+        speedups.encode,
+        encoding.IncrementalEncoder,
+        input,
+        [],
+        True,
+        "replace",
+        max_modifiers,
+        decomposer,
+    )
+    assert expected == actual
+
+
+@pytest.mark.parametrize("final", [False, True])
+@pytest.mark.parametrize("decoded_modifiers", [[], ["\u0301"], ["\u0301", "\u0308"]])
+@pytest.mark.parametrize("seed", range(5))
+def test_decode_compose_matches_python(encoding, seed, final, decoded_modifiers):
+    input = random_bytes(seed)
+    composer = ansel.incremental.compose_nfc
+    expected = decode_with(
+        ansel.incremental.py_decode,
+        encoding.IncrementalDecoder,
+        input,
+        decoded_modifiers,
+        final,
+        "replace",
+        composer=composer,
+    )
+    actual = decode_with(
+        speedups.decode,
+        encoding.IncrementalDecoder,
+        input,
+        decoded_modifiers,
+        final,
+        "replace",
+        composer=composer,
+    )
+    assert expected == actual